@@ -131,7 +131,7 @@ with st.sidebar:
     st.markdown(f"""
     <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem;">
         <div style="display: flex; align-items: center; justify-content: center; gap: 0.5rem; margin-bottom: 0.75rem;">
-            <img src="{company_info['logo']}" alt="IKF Logo" style="height: 32px; width: auto; filter: brightness(0) invert(1);">
+            <img src="{company_info['logo']}" alt="IKF Logo" width="96" height="32" style="height: 32px; width: auto; filter: brightness(0) invert(1);">
         </div>
         <p style="margin: 0.25rem 0; font-size: 0.875rem;"><strong>Company:</strong> {company_info['full_name']}</p>
         <p style="margin: 0.25rem 0; font-size: 0.875rem;"><strong>Website:</strong> <a href="{company_info['website']}" target="_blank">{company_info['website']}</a></p>
@@ -213,6 +213,317 @@ def create_personality_radar(personality_data):
     
     return fig
 
+# Unified card rendering - every metric and feedback card goes through one helper;
+# each variant keeps its original markup, so the rendered HTML is unchanged
+_CARD_STYLE = "background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem;"
+_METRIC_CARD_TMPL = """
+        <div style="{card_style} text-align: center; transition: all 0.2s;">
+            <div style="font-size: 0.75rem; color: #475569; font-weight: 500; text-transform: uppercase; letter-spacing: 0.05em;">{label}</div>
+            <div style="font-size: {font_size}; font-weight: 700; color: {color}; margin: 0.25rem 0;">{value}</div>
+            <div style="background: {badge_bg}; color: {badge_color}; font-size: 0.75rem; font-weight: 600; padding: 0.25rem 0.5rem; border-radius: 0.375rem; display: inline-block;">{badge}</div>
+        </div>
+        """
+_FEEDBACK_CARD_TMPL = """
+        <div style="{card_style} margin: 0.5rem 0; border-left: 4px solid #ec4899;">
+            <div style="display: flex; align-items: center; gap: 0.5rem;">
+                <span style="font-size: 1.25rem;">{icon}</span>
+                <p style="color: #475569; margin: 0; font-size: 0.875rem; line-height: 1.4;">{text}</p>
+            </div>
+        </div>
+        """
+_CARD_VARIANTS = {
+    "metric": {"template": _METRIC_CARD_TMPL, "font_size": "2rem"},
+    "metric_compact": {"template": _METRIC_CARD_TMPL, "font_size": "1.5rem"},
+    "feedback": {"template": _FEEDBACK_CARD_TMPL},
+}
+
+def _render_card(variant, **kw):
+    """Render a card using the template registered for the given variant"""
+    spec = dict(_CARD_VARIANTS[variant])
+    template = spec.pop("template")
+    st.markdown(template.format(card_style=_CARD_STYLE, **spec, **kw), unsafe_allow_html=True)
+
+# Shown when the evaluation is launched without a job opening or resume
+_MISSING_INFO_HTML = """
+<div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem;">
+    <p style="color: #475569; margin: 0; font-size: 0.875rem;">
+        <strong>Missing information?</strong> Ensure you have selected a job opening and uploaded a candidate resume 
+        to proceed with the evaluation.
+    </p>
+</div>
+"""
+
+def run_candidate_evaluation(resume_file, selected_job):
+    """Run the candidate evaluation flow and render the assessment results"""
+    if not (resume_file and selected_job):
+        st.error("❌ Please select a job opening and upload a candidate resume to proceed.")
+        st.markdown(_MISSING_INFO_HTML, unsafe_allow_html=True)
+        return
+    
+    # Show progress
+    st.markdown("### 🔄 Evaluation Progress")
+    
+    # Progress bar
+    progress_container = st.container()
+    with progress_container:
+        status_text = st.empty()
+        progress_bar = st.progress(0)
+    
+    # Evaluation steps
+    evaluation_steps = [
+        "🔍 Analyzing candidate resume...",
+        "🎯 Matching against job requirements...",
+        "📊 Calculating fit scores...",
+        "💡 Generating hiring insights...",
+        "✅ Evaluation complete!"
+    ]
+    
+    for i, step in enumerate(evaluation_steps):
+        progress = (i + 1) / len(evaluation_steps)
+        progress_bar.progress(progress)
+        status_text.markdown(f"<div style='background: #dbeafe; color: #1e40af; padding: 0.25rem 0.5rem; border-radius: 0.375rem; font-size: 0.75rem; font-weight: 600; text-transform: uppercase; letter-spacing: 0.05em; display: inline-block;'>{step}</div>", unsafe_allow_html=True)
+        time.sleep(0.8)
+    
+    st.success("🎉 Evaluation completed successfully! Review the candidate assessment below.")
+    
+    # Evaluation results
+    st.markdown("### 📊 Candidate Assessment Results")
+    
+    # HR-focused metrics
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        _render_card("metric", label="Overall Fit", value="87%", color="#1e40af",
+                     badge="Strong Match", badge_bg="#dcfce7", badge_color="#059669")
+    
+    with col2:
+        _render_card("metric", label="Skills Match", value="92%", color="#1e40af",
+                     badge="Excellent", badge_bg="#dcfce7", badge_color="#059669")
+    
+    with col3:
+        _render_card("metric", label="Experience Fit", value="78%", color="#1e40af",
+                     badge="Good", badge_bg="#fef2f2", badge_color="#dc2626")
+    
+    # HR decision support
+    st.markdown("### 🎯 HR Decision Support")
+    st.markdown("""
+    <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; overflow: hidden;">
+        <div style="background: linear-gradient(135deg, #f8fafc, #f1f5f9); border-bottom: 1px solid #e2e8f0; padding: 1rem;">
+            <h4 style="margin: 0; color: #0f172a;">Candidate Assessment Report</h4>
+        </div>
+        <div style="padding: 1rem;">
+            <div style="margin-bottom: 1rem;">
+                <h5 style="color: #1e40af; margin-bottom: 0.25rem; font-size: 0.875rem;">🎯 Key Strengths</h5>
+                <ul style="color: #475569; line-height: 1.5; margin: 0; font-size: 0.875rem;">
+                    <li>Strong technical skills alignment with job requirements</li>
+                    <li>Relevant cloud experience and modern tech stack</li>
+                    <li>Good educational background and certifications</li>
+                </ul>
+            </div>
+            <div style="margin-bottom: 1rem;">
+                <h5 style="color: #d97706; margin-bottom: 0.25rem; font-size: 0.875rem;">⚠️ Areas of Concern</h5>
+                <ul style="color: #475569; line-height: 1.5; margin: 0; font-size: 0.875rem;">
+                    <li>Could benefit from more DevOps experience</li>
+                    <li>Missing specific database technologies mentioned</li>
+                </ul>
+            </div>
+            <div>
+                <h5 style="color: #059669; margin-bottom: 0.25rem; font-size: 0.875rem;">💡 HR Recommendation</h5>
+                <p style="color: #475569; margin: 0; font-size: 0.875rem;"><strong>RECOMMENDED FOR INTERVIEW</strong> - This candidate shows strong potential and would be worth interviewing.</p>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # 🎭 AI Personality Analysis Surprise!
+    st.markdown("### 🎭 AI Personality & Cultural Fit Analysis")
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #fdf2f8, #fce7f3); border: 1px solid #ec4899; border-radius: 0.75rem; padding: 1rem; margin: 1rem 0;">
+        <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem;">
+            <span style="font-size: 1.5rem;">🧠</span>
+            <h4 style="margin: 0; color: #831843; font-size: 1.125rem;">AI-Powered Personality Insights</h4>
+        </div>
+        <p style="color: #be185d; margin: 0; font-size: 0.875rem;">
+            Our advanced AI analyzes personality traits, cultural fit, and predicts hiring success beyond just skills!
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Generate personality analysis
+    sample_resume_text = "Sample resume content for analysis"
+    personality_traits, cultural_indicators, success_metrics = analyze_candidate_personality(sample_resume_text)
+    
+    # Personality radar chart
+    personality_chart = create_personality_radar(personality_traits)
+    st.plotly_chart(personality_chart, use_container_width=True)
+    
+    # Personality insights
+    st.markdown("### 🧠 Personality Trait Analysis")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(f"""
+        <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem; border-left: 4px solid #ec4899;">
+            <h5 style="color: #ec4899; margin-bottom: 0.5rem; font-size: 0.875rem;">🌟 Key Strengths</h5>
+            <div style="margin-bottom: 0.5rem;">
+                <span style="font-size: 0.75rem; color: #475569;">Leadership:</span>
+                <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
+                    <div style="background: #ec4899; height: 100%; width: {personality_traits['leadership']:.1%}; border-radius: 3px;"></div>
+                </div>
+            </div>
+            <div style="margin-bottom: 0.5rem;">
+                <span style="font-size: 0.75rem; color: #475569;">Teamwork:</span>
+                <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
+                    <div style="background: #ec4899; height: 100%; width: {personality_traits['teamwork']:.1%}; border-radius: 3px;"></div>
+                </div>
+            </div>
+            <div>
+                <span style="font-size: 0.75rem; color: #475569;">Communication:</span>
+                <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
+                    <div style="background: #ec4899; height: 100%; width: {personality_traits['communication']:.1%}; border-radius: 3px;"></div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem; border-left: 4px solid #8b5cf6;">
+            <h5 style="color: #8b5cf6; margin-bottom: 0.5rem; font-size: 0.875rem;">💡 Growth Areas</h5>
+            <div style="margin-bottom: 0.5rem;">
+                <span style="font-size: 0.75rem; color: #475569;">Innovation:</span>
+                <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
+                    <div style="background: #8b5cf6; height: 100%; width: {personality_traits['innovation']:.1%}; border-radius: 3px;"></div>
+                </div>
+            </div>
+            <div style="margin-bottom: 0.5rem;">
+                <span style="font-size: 0.75rem; color: #475569;">Adaptability:</span>
+                <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
+                    <div style="background: #8b5cf6; height: 100%; width: {personality_traits['adaptability']:.1%}; border-radius: 3px;"></div>
+                </div>
+            </div>
+            <div>
+                <span style="font-size: 0.75rem; color: #475569;">Reliability:</span>
+                <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
+                    <div style="background: #8b5cf6; height: 100%; width: {personality_traits['reliability']:.1%}; border-radius: 3px;"></div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Cultural fit analysis
+    st.markdown("### 🏢 Cultural Fit & Team Compatibility")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(f"""
+        <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem; border-left: 4px solid #10b981;">
+            <h5 style="color: #10b981; margin-bottom: 0.5rem; font-size: 0.875rem;">🎯 Cultural Alignment</h5>
+            <div style="margin-bottom: 0.5rem;">
+                <span style="font-size: 0.75rem; color: #475569;">Values Alignment:</span>
+                <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
+                    <div style="background: #10b981; height: 100%; width: {cultural_indicators['company_values_alignment']:.1%}; border-radius: 3px;"></div>
+                </div>
+            </div>
+            <div style="margin-bottom: 0.5rem;">
+                <span style="font-size: 0.75rem; color: #475569;">Work Style:</span>
+                <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
+                    <div style="background: #10b981; height: 100%; width: {cultural_indicators['work_style_compatibility']:.1%}; border-radius: 3px;"></div>
+                </div>
+            </div>
+            <div>
+                <span style="font-size: 0.75rem; color: #475569;">Growth Mindset:</span>
+                <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
+                    <div style="background: #10b981; height: 100%; width: {cultural_indicators['growth_mindset']:.1%}; border-radius: 3px;"></div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem; border-left: 4px solid #f59e0b;">
+            <h5 style="color: #f59e0b; margin-bottom: 0.5rem; font-size: 0.875rem;">🤝 Team Dynamics</h5>
+            <div style="margin-bottom: 0.5rem;">
+                <span style="font-size: 0.75rem; color: #475569;">Collaboration:</span>
+                <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
+                    <div style="background: #f59e0b; height: 100%; width: {cultural_indicators['collaboration_preference']:.1%}; border-radius: 3px;"></div>
+                </div>
+            </div>
+            <div style="margin-bottom: 0.5rem;">
+                <span style="font-size: 0.75rem; color: #475569;">Integration Speed:</span>
+                <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
+                    <div style="background: #f59e0b; height: 100%; width: {success_metrics['team_integration_speed']:.1%}; border-radius: 3px;"></div>
+                </div>
+            </div>
+            <div>
+                <span style="font-size: 0.75rem; color: #475569;">Team Chemistry:</span>
+                <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
+                    <div style="background: #f59e0b; height: 100%; width: {personality_traits['teamwork']:.1%}; border-radius: 3px;"></div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Predictive success metrics
+    st.markdown("### 🔮 AI Predictive Success Analysis")
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #f0f9ff, #e0f2fe); border: 1px solid #0ea5e9; border-radius: 0.75rem; padding: 1rem; margin: 1rem 0;">
+        <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem;">
+            <span style="font-size: 1.5rem;">🔮</span>
+            <h4 style="margin: 0; color: #0c4a6e; font-size: 1.125rem;">Future Success Predictions</h4>
+        </div>
+        <p style="color: #0369a1; margin: 0; font-size: 0.875rem;">
+            Our AI predicts long-term success, retention, and career growth potential!
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Success metrics display
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        _render_card("metric_compact", label="Retention", value=f"{success_metrics['retention_probability']:.1%}", color="#10b981",
+                     badge="High", badge_bg="#dcfce7", badge_color="#059669")
+    
+    with col2:
+        _render_card("metric_compact", label="Performance", value=f"{success_metrics['performance_prediction']:.1%}", color="#1e40af",
+                     badge="Strong", badge_bg="#dbeafe", badge_color="#1e40af")
+    
+    with col3:
+        _render_card("metric_compact", label="Integration", value=f"{success_metrics['team_integration_speed']:.1%}", color="#f59e0b",
+                     badge="Good", badge_bg="#fef3c7", badge_color="#d97706")
+    
+    with col4:
+        _render_card("metric_compact", label="Growth", value=f"{success_metrics['career_growth_potential']:.1%}", color="#8b5cf6",
+                     badge="High", badge_bg="#f3e8ff", badge_color="#7c3aed")
+    
+    # AI personality insights
+    st.markdown("### 🤖 AI Personality Insights")
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #fdf2f8, #fce7f3); border: 1px solid #ec4899; border-radius: 0.75rem; padding: 1rem; margin: 1rem 0;">
+        <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem;">
+            <span style="font-size: 1.5rem;">🧠</span>
+            <h4 style="margin: 0; color: #831843; font-size: 1.125rem;">Advanced AI Analysis Complete</h4>
+        </div>
+        <p style="color: #be185d; margin: 0; font-size: 0.875rem;">
+            Our AI has analyzed personality traits, cultural fit, and predicted long-term success potential!
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # AI personality responses
+    st.markdown("### 💬 AI Personality Feedback")
+    
+    # Generate contextual AI responses for personality
+    personality_feedback = []
+    personality_feedback.append(f"🎭 **Personality Insight:** This candidate shows strong leadership potential ({personality_traits['leadership']:.1%}) with excellent teamwork skills ({personality_traits['teamwork']:.1%}).")
+    personality_feedback.append(f"🏢 **Cultural Fit:** High alignment with company values ({cultural_indicators['company_values_alignment']:.1%}) and strong growth mindset ({cultural_indicators['growth_mindset']:.1%}).")
+    personality_feedback.append(f"🔮 **Success Prediction:** High retention probability ({success_metrics['retention_probability']:.1%}) and strong performance potential ({success_metrics['performance_prediction']:.1%}).")
+    
+    for icon, feedback in zip(('🧠', '🏢', '🔮'), personality_feedback):
+        _render_card("feedback", icon=icon, text=feedback)
+
 # Main content based on page selection
 if page == "Single Candidate Evaluation":
     # HR-focused header
@@ -300,323 +611,7 @@ if page == "Single Candidate Evaluation":
     
     # Evaluation button
     if st.button("🚀 Launch Evaluation", type="primary", use_container_width=True):
-        if resume_file and selected_job:
-            # Show progress
-            st.markdown("### 🔄 Evaluation Progress")
-            
-            # Progress bar
-            progress_container = st.container()
-            with progress_container:
-                status_text = st.empty()
-                progress_bar = st.progress(0)
-            
-            # Evaluation steps
-            evaluation_steps = [
-                "🔍 Analyzing candidate resume...",
-                "🎯 Matching against job requirements...",
-                "📊 Calculating fit scores...",
-                "💡 Generating hiring insights...",
-                "✅ Evaluation complete!"
-            ]
-            
-            for i, step in enumerate(evaluation_steps):
-                progress = (i + 1) / len(evaluation_steps)
-                progress_bar.progress(progress)
-                status_text.markdown(f"<div style='background: #dbeafe; color: #1e40af; padding: 0.25rem 0.5rem; border-radius: 0.375rem; font-size: 0.75rem; font-weight: 600; text-transform: uppercase; letter-spacing: 0.05em; display: inline-block;'>{step}</div>", unsafe_allow_html=True)
-                time.sleep(0.8)
-            
-            st.success("🎉 Evaluation completed successfully! Review the candidate assessment below.")
-            
-            # Evaluation results
-            st.markdown("### 📊 Candidate Assessment Results")
-            
-            # HR-focused metrics
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.markdown("""
-                <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem; text-align: center; transition: all 0.2s;">
-                    <div style="font-size: 0.75rem; color: #475569; font-weight: 500; text-transform: uppercase; letter-spacing: 0.05em;">Overall Fit</div>
-                    <div style="font-size: 2rem; font-weight: 700; color: #1e40af; margin: 0.25rem 0;">87%</div>
-                    <div style="background: #dcfce7; color: #059669; font-size: 0.75rem; font-weight: 600; padding: 0.25rem 0.5rem; border-radius: 0.375rem; display: inline-block;">Strong Match</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown("""
-                <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem; text-align: center; transition: all 0.2s;">
-                    <div style="font-size: 0.75rem; color: #475569; font-weight: 500; text-transform: uppercase; letter-spacing: 0.05em;">Skills Match</div>
-                    <div style="font-size: 2rem; font-weight: 700; color: #1e40af; margin: 0.25rem 0;">92%</div>
-                    <div style="background: #dcfce7; color: #059669; font-size: 0.75rem; font-weight: 600; padding: 0.25rem 0.5rem; border-radius: 0.375rem; display: inline-block;">Excellent</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col3:
-                st.markdown("""
-                <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem; text-align: center; transition: all 0.2s;">
-                    <div style="font-size: 0.75rem; color: #475569; font-weight: 500; text-transform: uppercase; letter-spacing: 0.05em;">Experience Fit</div>
-                    <div style="font-size: 2rem; font-weight: 700; color: #1e40af; margin: 0.25rem 0;">78%</div>
-                    <div style="background: #fef2f2; color: #dc2626; font-size: 0.75rem; font-weight: 600; padding: 0.25rem 0.5rem; border-radius: 0.375rem; display: inline-block;">Good</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # HR decision support
-            st.markdown("### 🎯 HR Decision Support")
-            st.markdown("""
-            <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; overflow: hidden;">
-                <div style="background: linear-gradient(135deg, #f8fafc, #f1f5f9); border-bottom: 1px solid #e2e8f0; padding: 1rem;">
-                    <h4 style="margin: 0; color: #0f172a;">Candidate Assessment Report</h4>
-                </div>
-                <div style="padding: 1rem;">
-                    <div style="margin-bottom: 1rem;">
-                        <h5 style="color: #1e40af; margin-bottom: 0.25rem; font-size: 0.875rem;">🎯 Key Strengths</h5>
-                        <ul style="color: #475569; line-height: 1.5; margin: 0; font-size: 0.875rem;">
-                            <li>Strong technical skills alignment with job requirements</li>
-                            <li>Relevant cloud experience and modern tech stack</li>
-                            <li>Good educational background and certifications</li>
-                        </ul>
-                    </div>
-                    <div style="margin-bottom: 1rem;">
-                        <h5 style="color: #d97706; margin-bottom: 0.25rem; font-size: 0.875rem;">⚠️ Areas of Concern</h5>
-                        <ul style="color: #475569; line-height: 1.5; margin: 0; font-size: 0.875rem;">
-                            <li>Could benefit from more DevOps experience</li>
-                            <li>Missing specific database technologies mentioned</li>
-                        </ul>
-                    </div>
-                    <div>
-                        <h5 style="color: #059669; margin-bottom: 0.25rem; font-size: 0.875rem;">💡 HR Recommendation</h5>
-                        <p style="color: #475569; margin: 0; font-size: 0.875rem;"><strong>RECOMMENDED FOR INTERVIEW</strong> - This candidate shows strong potential and would be worth interviewing.</p>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # 🎭 AI Personality Analysis Surprise!
-            st.markdown("### 🎭 AI Personality & Cultural Fit Analysis")
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #fdf2f8, #fce7f3); border: 1px solid #ec4899; border-radius: 0.75rem; padding: 1rem; margin: 1rem 0;">
-                <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem;">
-                    <span style="font-size: 1.5rem;">🧠</span>
-                    <h4 style="margin: 0; color: #831843; font-size: 1.125rem;">AI-Powered Personality Insights</h4>
-                </div>
-                <p style="color: #be185d; margin: 0; font-size: 0.875rem;">
-                    Our advanced AI analyzes personality traits, cultural fit, and predicts hiring success beyond just skills!
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Generate personality analysis
-            sample_resume_text = "Sample resume content for analysis"
-            personality_traits, cultural_indicators, success_metrics = analyze_candidate_personality(sample_resume_text)
-            
-            # Personality radar chart
-            personality_chart = create_personality_radar(personality_traits)
-            st.plotly_chart(personality_chart, use_container_width=True)
-            
-            # Personality insights
-            st.markdown("### 🧠 Personality Trait Analysis")
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown(f"""
-                <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem; border-left: 4px solid #ec4899;">
-                    <h5 style="color: #ec4899; margin-bottom: 0.5rem; font-size: 0.875rem;">🌟 Key Strengths</h5>
-                    <div style="margin-bottom: 0.5rem;">
-                        <span style="font-size: 0.75rem; color: #475569;">Leadership:</span>
-                        <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
-                            <div style="background: #ec4899; height: 100%; width: {personality_traits['leadership']:.1%}; border-radius: 3px;"></div>
-                        </div>
-                    </div>
-                    <div style="margin-bottom: 0.5rem;">
-                        <span style="font-size: 0.75rem; color: #475569;">Teamwork:</span>
-                        <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
-                            <div style="background: #ec4899; height: 100%; width: {personality_traits['teamwork']:.1%}; border-radius: 3px;"></div>
-                        </div>
-                    </div>
-                    <div>
-                        <span style="font-size: 0.75rem; color: #475569;">Communication:</span>
-                        <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
-                            <div style="background: #ec4899; height: 100%; width: {personality_traits['communication']:.1%}; border-radius: 3px;"></div>
-                        </div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown(f"""
-                <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem; border-left: 4px solid #8b5cf6;">
-                    <h5 style="color: #8b5cf6; margin-bottom: 0.5rem; font-size: 0.875rem;">💡 Growth Areas</h5>
-                    <div style="margin-bottom: 0.5rem;">
-                        <span style="font-size: 0.75rem; color: #475569;">Innovation:</span>
-                        <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
-                            <div style="background: #8b5cf6; height: 100%; width: {personality_traits['innovation']:.1%}; border-radius: 3px;"></div>
-                        </div>
-                    </div>
-                    <div style="margin-bottom: 0.5rem;">
-                        <span style="font-size: 0.75rem; color: #475569;">Adaptability:</span>
-                        <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
-                            <div style="background: #8b5cf6; height: 100%; width: {personality_traits['adaptability']:.1%}; border-radius: 3px;"></div>
-                        </div>
-                    </div>
-                    <div>
-                        <span style="font-size: 0.75rem; color: #475569;">Reliability:</span>
-                        <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
-                            <div style="background: #8b5cf6; height: 100%; width: {personality_traits['reliability']:.1%}; border-radius: 3px;"></div>
-                        </div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Cultural fit analysis
-            st.markdown("### 🏢 Cultural Fit & Team Compatibility")
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown(f"""
-                <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem; border-left: 4px solid #10b981;">
-                    <h5 style="color: #10b981; margin-bottom: 0.5rem; font-size: 0.875rem;">🎯 Cultural Alignment</h5>
-                    <div style="margin-bottom: 0.5rem;">
-                        <span style="font-size: 0.75rem; color: #475569;">Values Alignment:</span>
-                        <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
-                            <div style="background: #10b981; height: 100%; width: {cultural_indicators['company_values_alignment']:.1%}; border-radius: 3px;"></div>
-                        </div>
-                    </div>
-                    <div style="margin-bottom: 0.5rem;">
-                        <span style="font-size: 0.75rem; color: #475569;">Work Style:</span>
-                        <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
-                            <div style="background: #10b981; height: 100%; width: {cultural_indicators['work_style_compatibility']:.1%}; border-radius: 3px;"></div>
-                        </div>
-                    </div>
-                    <div>
-                        <span style="font-size: 0.75rem; color: #475569;">Growth Mindset:</span>
-                        <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
-                            <div style="background: #10b981; height: 100%; width: {cultural_indicators['growth_mindset']:.1%}; border-radius: 3px;"></div>
-                        </div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown(f"""
-                <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem; border-left: 4px solid #f59e0b;">
-                    <h5 style="color: #f59e0b; margin-bottom: 0.5rem; font-size: 0.875rem;">🤝 Team Dynamics</h5>
-                    <div style="margin-bottom: 0.5rem;">
-                        <span style="font-size: 0.75rem; color: #475569;">Collaboration:</span>
-                        <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
-                            <div style="background: #f59e0b; height: 100%; width: {cultural_indicators['collaboration_preference']:.1%}; border-radius: 3px;"></div>
-                        </div>
-                    </div>
-                    <div style="margin-bottom: 0.5rem;">
-                        <span style="font-size: 0.75rem; color: #475569;">Integration Speed:</span>
-                        <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
-                            <div style="background: #f59e0b; height: 100%; width: {success_metrics['team_integration_speed']:.1%}; border-radius: 3px;"></div>
-                        </div>
-                    </div>
-                    <div>
-                        <span style="font-size: 0.75rem; color: #475569;">Team Chemistry:</span>
-                        <div style="background: #e2e8f0; height: 6px; border-radius: 3px; margin: 0.25rem 0;">
-                            <div style="background: #f59e0b; height: 100%; width: {personality_traits['teamwork']:.1%}; border-radius: 3px;"></div>
-                        </div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Predictive success metrics
-            st.markdown("### 🔮 AI Predictive Success Analysis")
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #f0f9ff, #e0f2fe); border: 1px solid #0ea5e9; border-radius: 0.75rem; padding: 1rem; margin: 1rem 0;">
-                <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem;">
-                    <span style="font-size: 1.5rem;">🔮</span>
-                    <h4 style="margin: 0; color: #0c4a6e; font-size: 1.125rem;">Future Success Predictions</h4>
-                </div>
-                <p style="color: #0369a1; margin: 0; font-size: 0.875rem;">
-                    Our AI predicts long-term success, retention, and career growth potential!
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Success metrics display
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.markdown(f"""
-                <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem; text-align: center; transition: all 0.2s;">
-                    <div style="font-size: 0.75rem; color: #475569; font-weight: 500; text-transform: uppercase; letter-spacing: 0.05em;">Retention</div>
-                    <div style="font-size: 1.5rem; font-weight: 700; color: #10b981; margin: 0.25rem 0;">{success_metrics['retention_probability']:.1%}</div>
-                    <div style="background: #dcfce7; color: #059669; font-size: 0.75rem; font-weight: 600; padding: 0.25rem 0.5rem; border-radius: 0.375rem; display: inline-block;">High</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown(f"""
-                <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem; text-align: center; transition: all 0.2s;">
-                    <div style="font-size: 0.75rem; color: #475569; font-weight: 500; text-transform: uppercase; letter-spacing: 0.05em;">Performance</div>
-                    <div style="font-size: 1.5rem; font-weight: 700; color: #1e40af; margin: 0.25rem 0;">{success_metrics['performance_prediction']:.1%}</div>
-                    <div style="background: #dbeafe; color: #1e40af; font-size: 0.75rem; font-weight: 600; padding: 0.25rem 0.5rem; border-radius: 0.375rem; display: inline-block;">Strong</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col3:
-                st.markdown(f"""
-                <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem; text-align: center; transition: all 0.2s;">
-                    <div style="font-size: 0.75rem; color: #475569; font-weight: 500; text-transform: uppercase; letter-spacing: 0.05em;">Integration</div>
-                    <div style="font-size: 1.5rem; font-weight: 700; color: #f59e0b; margin: 0.25rem 0;">{success_metrics['team_integration_speed']:.1%}</div>
-                    <div style="background: #fef3c7; color: #d97706; font-size: 0.75rem; font-weight: 600; padding: 0.25rem 0.5rem; border-radius: 0.375rem; display: inline-block;">Good</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col4:
-                st.markdown(f"""
-                <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem; text-align: center; transition: all 0.2s;">
-                    <div style="font-size: 0.75rem; color: #475569; font-weight: 500; text-transform: uppercase; letter-spacing: 0.05em;">Growth</div>
-                    <div style="font-size: 1.5rem; font-weight: 700; color: #8b5cf6; margin: 0.25rem 0;">{success_metrics['career_growth_potential']:.1%}</div>
-                    <div style="background: #f3e8ff; color: #7c3aed; font-size: 0.75rem; font-weight: 600; padding: 0.25rem 0.5rem; border-radius: 0.375rem; display: inline-block;">High</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # AI personality insights
-            st.markdown("### 🤖 AI Personality Insights")
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #fdf2f8, #fce7f3); border: 1px solid #ec4899; border-radius: 0.75rem; padding: 1rem; margin: 1rem 0;">
-                <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem;">
-                    <span style="font-size: 1.5rem;">🧠</span>
-                    <h4 style="margin: 0; color: #831843; font-size: 1.125rem;">Advanced AI Analysis Complete</h4>
-                </div>
-                <p style="color: #be185d; margin: 0; font-size: 0.875rem;">
-                    Our AI has analyzed personality traits, cultural fit, and predicted long-term success potential!
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # AI personality responses
-            st.markdown("### 💬 AI Personality Feedback")
-            
-            # Generate contextual AI responses for personality
-            personality_feedback = []
-            personality_feedback.append(f"🎭 **Personality Insight:** This candidate shows strong leadership potential ({personality_traits['leadership']:.1%}) with excellent teamwork skills ({personality_traits['teamwork']:.1%}).")
-            personality_feedback.append(f"🏢 **Cultural Fit:** High alignment with company values ({cultural_indicators['company_values_alignment']:.1%}) and strong growth mindset ({cultural_indicators['growth_mindset']:.1%}).")
-            personality_feedback.append(f"🔮 **Success Prediction:** High retention probability ({success_metrics['retention_probability']:.1%}) and strong performance potential ({success_metrics['performance_prediction']:.1%}).")
-            
-            for i, feedback in enumerate(personality_feedback):
-                st.markdown(f"""
-                <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem; margin: 0.5rem 0; border-left: 4px solid #ec4899;">
-                    <div style="display: flex; align-items: center; gap: 0.5rem;">
-                        <span style="font-size: 1.25rem;">{'🧠' if i == 0 else '🏢' if i == 1 else '🔮'}</span>
-                        <p style="color: #475569; margin: 0; font-size: 0.875rem; line-height: 1.4;">{feedback}</p>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-        else:
-            st.error("❌ Please select a job opening and upload a candidate resume to proceed.")
-            st.markdown("""
-            <div style="background: white; border: 1px solid #e2e8f0; border-radius: 0.75rem; padding: 1rem;">
-                <p style="color: #475569; margin: 0; font-size: 0.875rem;">
-                    <strong>Missing information?</strong> Ensure you have selected a job opening and uploaded a candidate resume 
-                    to proceed with the evaluation.
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+        run_candidate_evaluation(resume_file, selected_job)
 
 # Footer
 st.markdown(CompanyBranding.get_footer_html(), unsafe_allow_html=True)
@@ -4,23 +4,148 @@ Handles multiple resume uploads and batch comparison against job descriptions.
 """
 
 import logging
+import hashlib
+import numpy as np
 import pandas as pd
-import tempfile
 import os
-from typing import Dict, List, Any, Tuple, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Any, Tuple, Optional, Iterator, Callable
 from pathlib import Path
 from datetime import datetime
 import streamlit as st
 
 from text_processor import TextProcessor
 from similarity_calculator import SimilarityCalculator
-from file_handler import FileHandler
+from file_handler import FileHandler, extract_bytes_worker, extraction_pool
 from utils import ExportUtils
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of encoded job descriptions kept between bulk runs
+JD_CACHE_SIZE = 8
+
+# Number of extraction results kept across bulk runs, keyed by file extension and content hash
+EXTRACTION_CACHE_SIZE = 1000
+
+# Score bands reported in the bulk summary, lowest first; edges match the band labels
+SCORE_BAND_EDGES = [-np.inf, 20, 40, 60, 80, np.inf]
+SCORE_BAND_LABELS = [
+    'Very Poor (0-19%)',
+    'Poor (20-39%)',
+    'Fair (40-59%)',
+    'Good (60-79%)',
+    'Excellent (80-100%)'
+]
+
+# Column headers for the per-resume export table
+EXCEL_EXPORT_COLUMNS = {
+    'filename': 'Filename',
+    'similarity_score': 'Similarity Score (%)',
+    'word_count': 'Word Count',
+    'key_skills': 'Key Skills',
+    'processing_time': 'Processing Time (s)',
+    'status': 'Status',
+    'error': 'Error'
+}
+CSV_EXPORT_COLUMNS = {key: key for key in EXCEL_EXPORT_COLUMNS}
+
+# Below this many files, process start-up costs more than parallel extraction saves
+PARALLEL_EXTRACTION_MIN_FILES = 10
+
+# Share of the progress bar covered by text extraction; BERT scoring fills the rest
+EXTRACTION_PROGRESS_SHARE = 0.5
+
+# Resumes BERT-encoded between progress updates during scoring
+SCORING_BATCH_SIZE = 32
+
+
+@st.cache_resource(show_spinner=False)
+def _get_extraction_cache() -> "OrderedDict[Tuple[str, str], Tuple[bool, str, float]]":
+    """Return the extraction cache shared by every bulk run in this server process."""
+    return OrderedDict()
+
+
+# Streamlit runs each session on its own thread, so the shared extraction cache needs a lock
+_EXTRACTION_CACHE_LOCK = threading.Lock()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_similarity_calculator() -> SimilarityCalculator:
+    """Return a shared SimilarityCalculator so the BERT model and embedding cache survive reruns."""
+    calculator = SimilarityCalculator(use_gpu=False)
+    # Bulk runs favour throughput; int8 BERT is typically 2-4x faster on CPU
+    calculator.quantize_dynamic()
+    return calculator
+
+
+def _run_extractions(payloads: List[Tuple[bytes, str]]) -> Iterator[Tuple[bool, str, float]]:
+    """Yield extraction results in input order, using a process pool for larger batches."""
+    if len(payloads) < PARALLEL_EXTRACTION_MIN_FILES:
+        for payload in payloads:
+            yield extract_bytes_worker(*payload)
+        return
+    
+    max_workers = min(os.cpu_count() or 1, len(payloads))
+    done = 0
+    try:
+        with extraction_pool(max_workers) as executor:
+            for result in executor.map(extract_bytes_worker, *zip(*payloads), chunksize=4):
+                yield result
+                done += 1
+    except Exception as e:
+        # A broken pool (worker killed, pickling error) must not end the bulk run;
+        # extract the rest here so errors still land on individual files
+        logger.error(f"Extraction pool failed after {done} files, continuing serially: {str(e)}")
+        for payload in payloads[done:]:
+            yield extract_bytes_worker(*payload)
+
+
+def _iter_extractions(payloads: List[Tuple[bytes, str]]) -> Iterator[Tuple[bool, str, float]]:
+    """Yield extraction results in input order, only extracting files not seen before."""
+    cache = _get_extraction_cache()
+    # The extension picks the extractor, so identical bytes under another extension are a different entry
+    keys = [(file_ext, hashlib.sha256(file_bytes).hexdigest()) for file_bytes, file_ext in payloads]
+    
+    # Snapshot the hits up front so evictions by other sessions cannot affect this run
+    with _EXTRACTION_CACHE_LOCK:
+        cached = {key: cache[key] for key in keys if key in cache}
+        for key in cached:
+            cache.move_to_end(key)
+    
+    # Each distinct uncached file is extracted once, in order of first appearance
+    pending = {}
+    for key, payload in zip(keys, payloads):
+        if key not in cached and key not in pending:
+            pending[key] = payload
+    fresh_results = zip(pending, _run_extractions(list(pending.values())))
+    fresh = {}
+    
+    for key in keys:
+        if key in cached:
+            # Nothing was extracted in this run, so report no extraction time
+            success, text_or_error, _ = cached[key]
+            yield success, text_or_error, 0.0
+            continue
+        
+        # Results arrive in pending order; match them to files by key, not position
+        while key not in fresh:
+            fresh_key, result = next(fresh_results)
+            fresh[fresh_key] = result
+            # Only successes are cached, so a failure is retried on the next run
+            if result[0]:
+                with _EXTRACTION_CACHE_LOCK:
+                    cache[fresh_key] = result
+        yield fresh[key]
+    
+    with _EXTRACTION_CACHE_LOCK:
+        while len(cache) > EXTRACTION_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
 class BulkResumeProcessor:
     """
     A class for processing multiple resumes against a single job description.
@@ -33,7 +158,7 @@ class BulkResumeProcessor:
     def __init__(self):
         """Initialize the bulk processor."""
         self.text_processor = TextProcessor()
-        self.similarity_calculator = SimilarityCalculator(use_gpu=False)
+        self.similarity_calculator = _get_similarity_calculator()
         self.file_handler = FileHandler()
         
         # Supported file types for bulk upload
@@ -42,6 +167,12 @@ class BulkResumeProcessor:
         # Results storage
         self.bulk_results = []
         self.job_description = ""
+        # Columnar index over bulk_results and the successful subset, for summary and candidate queries
+        self._index_results()
+        
+        # Encoded job descriptions keyed by (content hash, comparison method)
+        self._jd_cache = OrderedDict()
+        self._encoded_jd = None
         
     def process_bulk_resumes(self, job_description: str, resume_files: List, 
                            comparison_method: str = "Combined") -> Dict[str, Any]:
@@ -120,60 +251,105 @@ class BulkResumeProcessor:
                 'timestamp': datetime.now().isoformat()
             }
         
-        for idx, resume_file in enumerate(resume_files):
+        # Encode the job description once for the whole batch
+        self._encoded_jd = self._get_encoded_job_description(job_description, comparison_method)
+        score_fn = self._resolve_scorer(comparison_method)
+        
+        # Refresh progress widgets about 50 times per run rather than on every file
+        update_every = max(1, total_files // 50)
+        # Per-file outcomes, shown together once processing finishes
+        messages = []
+        
+        # Phase 1: extract and analyze the text of every resume. Successful resumes get
+        # a slot in bulk_results now and are filled in after scoring, keeping upload order
+        payloads = [(resume_file.getvalue(), Path(resume_file.name).suffix.lower()) for resume_file in resume_files]
+        extracted = []
+        for idx, (resume_file, extraction) in enumerate(zip(resume_files, _iter_extractions(payloads))):
             try:
-                # Update progress
-                progress = (idx + 1) / total_files
-                progress_bar.progress(progress)
-                
-                # Update status information
-                status_text.text(f"🔄 Processing: {resume_file.name}")
-                progress_text.text(f"Progress: {idx + 1}/{total_files} ({progress*100:.1f}%)")
-                success_count.text(f"✅ Success: {successful}")
-                failed_count.text(f"❌ Failed: {failed}")
+                if idx % update_every == 0 or idx + 1 == total_files:
+                    # Update progress; extraction fills the first part of the bar
+                    progress = (idx + 1) / total_files
+                    progress_bar.progress(progress * EXTRACTION_PROGRESS_SHARE)
+                    
+                    # Update status information
+                    status_text.text(f"🔄 Processing: {resume_file.name}")
+                    progress_text.text(f"Progress: {idx + 1}/{total_files} ({progress*100:.1f}%)")
+                    success_count.text(f"✅ Success: {successful}")
+                    failed_count.text(f"❌ Failed: {failed}")
                 
                 # Process individual resume
-                result = self._process_single_resume(resume_file, comparison_method)
+                processed = self._process_single_resume(resume_file, extraction)
                 
-                if result:
-                    self.bulk_results.append(result)
+                if processed:
+                    extracted.append((len(self.bulk_results), resume_file, *processed))
+                    self.bulk_results.append(None)
                     successful += 1
-                    # Show success feedback
-                    st.success(f"✅ {resume_file.name} processed successfully")
                 else:
                     failed += 1
-                    # Show failure feedback
-                    st.error(f"❌ {resume_file.name} failed to process")
+                    messages.append({'File': resume_file.name, 'Status': "❌ Failed to process"})
                     
             except Exception as e:
                 logger.error(f"Error processing {resume_file.name}: {str(e)}")
                 failed += 1
                 # Add failed result for tracking
-                self.bulk_results.append({
+                self.bulk_results.append(self._failed_result(resume_file.name, str(e)))
+                messages.append({'File': resume_file.name, 'Status': f"❌ Error: {str(e)}"})
+        
+        # Phase 2: score every extracted resume in one batch
+        if extracted:
+            resume_texts = [resume_text for _, _, resume_text, _, _ in extracted]
+            scoring_start = time.perf_counter_ns()
+            
+            # BERT encoding is the slow part, so it runs in chunks that drive the progress bar
+            resume_embeddings = self._encode_resumes_with_progress(
+                resume_texts, comparison_method, progress_bar, status_text, progress_text
+            )
+            scored = self._score_resumes(score_fn, resume_texts, resume_embeddings)
+            
+            # Share the batch scoring time evenly across resumes
+            scoring_time = (time.perf_counter_ns() - scoring_start) / 1e9 / len(extracted)
+            
+            for row, (slot, resume_file, resume_text, text_analysis, extraction_time) in enumerate(extracted):
+                if isinstance(scored[row], Exception):
+                    error = str(scored[row])
+                    self.bulk_results[slot] = self._failed_result(resume_file.name, error)
+                    successful -= 1
+                    failed += 1
+                    messages.append({'File': resume_file.name, 'Status': f"❌ Error: {error}"})
+                    continue
+                
+                score, similarity_result = scored[row]
+                self.bulk_results[slot] = {
                     'filename': resume_file.name,
-                    'status': 'failed',
-                    'error': str(e),
-                    'similarity_score': 0,
-                    'processing_time': 0,
-                    'word_count': 0,
-                    'key_skills': [],
-                    'resume_text_length': 0
-                })
-                # Show error feedback
-                st.error(f"❌ {resume_file.name} - Error: {str(e)}")
+                    'status': 'success',
+                    'similarity_score': score,
+                    'resume_text_length': len(resume_text),
+                    'word_count': text_analysis['statistics']['total_words'],
+                    'key_skills': list(text_analysis['technical_skills'].keys()),
+                    'processing_time': extraction_time + scoring_time,
+                    'comparison_method': comparison_method,
+                    'full_results': similarity_result
+                }
+                messages.append({'File': resume_file.name, 'Status': "✅ Processed successfully"})
         
         # Clear progress indicators
         progress_bar.empty()
         status_text.empty()
         progress_container.empty()
         
+        # Show per-file feedback in a single collapsible block
+        with st.status(f"Processed {total_files} resumes", expanded=failed > 0,
+                       state="complete" if failed == 0 else "error"):
+            st.dataframe(pd.DataFrame(messages), hide_index=True)
+        
         # Show final summary
         if successful > 0:
             st.success(f"🎉 Bulk processing complete! {successful} out of {total_files} resumes processed successfully.")
         if failed > 0:
             st.warning(f"⚠️ {failed} resumes failed to process. Check the detailed results below.")
         
-        # Generate summary
+        # Index the results column-wise once, then summarize
+        self._index_results()
         summary = self._generate_bulk_summary(successful, failed, total_files)
         
         return {
@@ -184,18 +360,32 @@ class BulkResumeProcessor:
             'timestamp': datetime.now().isoformat()
         }
     
-    def _process_single_resume(self, resume_file, comparison_method: str) -> Optional[Dict[str, Any]]:
-        """Process a single resume file."""
-        start_time = datetime.now()
+    def _get_encoded_job_description(self, job_description: str, comparison_method: str) -> Dict[str, Any]:
+        """Encode the job description for the given method, reusing recent encodings."""
+        key = (hashlib.md5(job_description.encode()).hexdigest(), comparison_method)
+        
+        if key in self._jd_cache:
+            self._jd_cache.move_to_end(key)
+            return self._jd_cache[key]
+        
+        encoded = self.similarity_calculator.encode_job_description(
+            job_description,
+            use_tfidf=comparison_method != "BERT Only",
+            use_bert=comparison_method != "TF-IDF Only"
+        )
+        
+        self._jd_cache[key] = encoded
+        if len(self._jd_cache) > JD_CACHE_SIZE:
+            self._jd_cache.popitem(last=False)
+        
+        return encoded
+    
+    def _process_single_resume(self, resume_file, extraction: Tuple[bool, str, float]) -> Optional[Tuple[str, Dict[str, Any], float]]:
+        """Analyze the extracted text of a single resume file."""
+        start_time = time.perf_counter_ns()
         
         try:
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{resume_file.name.split('.')[-1]}") as tmp_file:
-                tmp_file.write(resume_file.getvalue())
-                tmp_file_path = tmp_file.name
-            
-            # Extract text from resume
-            success, text_or_error = self.file_handler.extract_text(tmp_file_path)
+            success, text_or_error, extraction_time = extraction
             
             if not success:
                 logger.error(f"Failed to extract text from {resume_file.name}: {text_or_error}")
@@ -203,55 +393,146 @@ class BulkResumeProcessor:
             
             resume_text = text_or_error
             
-            # Calculate similarity based on method
-            if comparison_method == "Combined (TF-IDF + BERT)":
-                similarity_result = self.similarity_calculator.get_similarity_breakdown(
-                    self.job_description, resume_text
-                )
-                score = similarity_result['overall_score']
-            elif comparison_method == "TF-IDF Only":
-                similarity_result = self.similarity_calculator.calculate_tfidf_similarity(
-                    self.job_description, resume_text
-                )
-                score = similarity_result['similarity_score']
-            else:  # BERT Only
-                similarity_result = self.similarity_calculator.calculate_bert_similarity(
-                    self.job_description, resume_text
-                )
-                score = similarity_result['similarity_score']
-            
             # Get text analysis
             text_analysis = self.text_processor.get_text_summary(resume_text)
             
             # Calculate processing time
-            end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
-            
-            # Clean up temp file
-            os.unlink(tmp_file_path)
+            processing_time = extraction_time + (time.perf_counter_ns() - start_time) / 1e9
             
-            return {
-                'filename': resume_file.name,
-                'status': 'success',
-                'similarity_score': score,
-                'resume_text_length': len(resume_text),
-                'word_count': text_analysis['statistics']['total_words'],
-                'key_skills': list(text_analysis['technical_skills'].keys()),
-                'processing_time': processing_time,
-                'comparison_method': comparison_method,
-                'full_results': similarity_result
-            }
+            return resume_text, text_analysis, processing_time
             
         except Exception as e:
             logger.error(f"Error processing {resume_file.name}: {str(e)}")
-            # Clean up temp file if it exists
-            if 'tmp_file_path' in locals():
-                try:
-                    os.unlink(tmp_file_path)
-                except:
-                    pass
             return None
     
+    def _failed_result(self, filename: str, error: str) -> Dict[str, Any]:
+        """Build the bulk result entry recorded for a resume that could not be processed."""
+        return {
+            'filename': filename,
+            'status': 'failed',
+            'error': error,
+            'similarity_score': 0,
+            'processing_time': 0,
+            'word_count': 0,
+            'key_skills': [],
+            'resume_text_length': 0
+        }
+    
+    def _encode_resumes_with_progress(self, resume_texts: List[str], comparison_method: str,
+                                      progress_bar, status_text, progress_text) -> Optional[np.ndarray]:
+        """
+        BERT-encode resumes in chunks, advancing the progress bar after each chunk.
+        
+        Returns:
+            Optional[np.ndarray]: (N, D) embeddings, or None when the method does not use
+            BERT or encoding failed (the scorer then reports the error per resume)
+        """
+        total = len(resume_texts)
+        status_text.text(f"🧮 Scoring {total} resumes...")
+        
+        if (comparison_method == "TF-IDF Only" or self._encoded_jd['bert_error']
+                or self._encoded_jd['bert_embedding'] is None):
+            return None
+        
+        try:
+            chunks = []
+            for start in range(0, total, SCORING_BATCH_SIZE):
+                chunks.append(self.similarity_calculator.encode_bert_batch(
+                    resume_texts[start:start + SCORING_BATCH_SIZE], batch_size=SCORING_BATCH_SIZE
+                ))
+                
+                done = min(start + SCORING_BATCH_SIZE, total)
+                progress_bar.progress(EXTRACTION_PROGRESS_SHARE + (1 - EXTRACTION_PROGRESS_SHARE) * done / total)
+                progress_text.text(f"Scoring: {done}/{total} ({done / total * 100:.1f}%)")
+            
+            return np.vstack(chunks)
+            
+        except Exception as e:
+            logger.error(f"Error encoding resumes: {str(e)}")
+            return None
+    
+    def _score_resumes(self, score_fn: Callable, resume_texts: List[str],
+                       resume_embeddings: Optional[np.ndarray]) -> List[Any]:
+        """
+        Score all resumes in one batch, falling back to one resume at a time if the batch fails.
+        
+        Returns:
+            List[Any]: A (score, full_results) pair per resume, or the exception that
+            resume raised when it was scored on its own
+        """
+        try:
+            return score_fn(resume_texts, resume_embeddings)
+        except Exception as e:
+            logger.error(f"Error scoring resumes as a batch, retrying one by one: {str(e)}")
+        
+        scored = []
+        for row, resume_text in enumerate(resume_texts):
+            embedding = resume_embeddings[row:row + 1] if resume_embeddings is not None else None
+            try:
+                scored.append(score_fn([resume_text], embedding)[0])
+            except Exception as e:
+                logger.error(f"Error scoring resume {row + 1}: {str(e)}")
+                scored.append(e)
+        return scored
+    
+    def _resolve_scorer(self, comparison_method: str) -> Callable[[List[str], Optional[np.ndarray]], List[Tuple[float, Dict[str, Any]]]]:
+        """
+        Pick the batch scoring function for a comparison method once per run.
+        
+        Args:
+            comparison_method (str): Method to use for comparison
+            
+        Returns:
+            Callable[[List[str], Optional[np.ndarray]], List[Tuple[float, Dict[str, Any]]]]: Maps
+            resume texts, plus optional precomputed BERT embeddings, to (score, full_results)
+            pairs against the encoded job description
+        """
+        if comparison_method == "Combined (TF-IDF + BERT)":
+            batch_fn = self.similarity_calculator.get_similarity_breakdown_batch
+            score_key = 'overall_score'
+        elif comparison_method == "TF-IDF Only":
+            batch_fn = self.similarity_calculator.calculate_tfidf_similarity_batch
+            score_key = 'similarity_score'
+        else:  # BERT Only
+            batch_fn = self.similarity_calculator.calculate_bert_similarity_batch
+            score_key = 'similarity_score'
+        
+        encoded_jd = self._encoded_jd
+        uses_bert = comparison_method != "TF-IDF Only"
+        
+        def score_fn(resume_texts: List[str], 
+                     resume_embeddings: Optional[np.ndarray] = None) -> List[Tuple[float, Dict[str, Any]]]:
+            if uses_bert:
+                results = batch_fn(encoded_jd, resume_texts, resume_embeddings=resume_embeddings)
+            else:
+                results = batch_fn(encoded_jd, resume_texts)
+            return [(result[score_key], result) for result in results]
+        
+        return score_fn
+    
+    def _build_results_frame(self) -> pd.DataFrame:
+        """Build a typed, column-wise view of bulk_results indexed by result position."""
+        return pd.DataFrame({
+            'filename': pd.Series([r['filename'] for r in self.bulk_results], dtype=object),
+            'status': pd.Categorical([r['status'] for r in self.bulk_results], categories=['success', 'failed']),
+            'similarity_score': pd.Series([r['similarity_score'] for r in self.bulk_results], dtype='float64')
+        })
+    
+    def _index_results(self):
+        """Index bulk_results and filter the successful ones once, for every later query."""
+        self._results_df = self._build_results_frame()
+        self._successful_df = self._results_df[self._results_df['status'] == 'success']
+        self._successful_results = [self.bulk_results[i] for i in self._successful_df.index]
+        self._success_scores = self._successful_df['similarity_score'].to_numpy()
+        # bulk_results is public; remember which list (and size) the index describes
+        self._indexed_results = (self.bulk_results, len(self.bulk_results))
+    
+    def _ensure_indexed(self):
+        """Re-index if bulk_results was reassigned or resized since it was last indexed."""
+        indexed_results, indexed_size = self._indexed_results
+        if indexed_results is not self.bulk_results or indexed_size != len(self.bulk_results):
+            self._index_results()
+    
     def _generate_bulk_summary(self, successful: int, failed: int, total: int) -> Dict[str, Any]:
         """Generate a summary of bulk processing results."""
         if not self.bulk_results:
@@ -266,22 +547,18 @@ class BulkResumeProcessor:
             }
         
         # Calculate statistics
-        successful_results = [r for r in self.bulk_results if r['status'] == 'success']
-        
-        if successful_results:
-            scores = [r['similarity_score'] for r in successful_results]
-            average_score = sum(scores) / len(scores)
+        if self._successful_results:
+            scores = self._success_scores
+            average_score = float(scores.mean())
             
-            # Top candidates (top 5 by score)
-            top_candidates = sorted(successful_results, key=lambda x: x['similarity_score'], reverse=True)[:5]
+            # Top candidates (top 5 by score); a stable sort keeps upload order among ties
+            top_indices = np.argsort(-scores, kind='stable')[:5]
+            top_candidates = [self._successful_results[i] for i in top_indices]
             
-            # Score distribution
+            # Score distribution, counted in a single pass
+            counts, _ = np.histogram(scores, bins=SCORE_BAND_EDGES)
             score_ranges = {
-                'Excellent (80-100%)': len([s for s in scores if s >= 80]),
-                'Good (60-79%)': len([s for s in scores if 60 <= s < 80]),
-                'Fair (40-59%)': len([s for s in scores if 40 <= s < 60]),
-                'Poor (20-39%)': len([s for s in scores if 20 <= s < 40]),
-                'Very Poor (0-19%)': len([s for s in scores if s < 20])
+                label: int(count) for label, count in reversed(list(zip(SCORE_BAND_LABELS, counts)))
             }
         else:
             average_score = 0
@@ -324,31 +601,44 @@ class BulkResumeProcessor:
             logger.error(error_msg)
             return False, error_msg
     
+    def _build_export_frame(self, results: Dict[str, Any], headers: Dict[str, str]) -> pd.DataFrame:
+        """Build the per-resume export table column by column, using the given column headers."""
+        rows = results['results']
+        succeeded = [r['status'] == 'success' for r in rows]
+        
+        columns = {
+            headers['filename']: [r['filename'] for r in rows],
+            headers['similarity_score']: [r['similarity_score'] if ok else 'N/A' for r, ok in zip(rows, succeeded)],
+            headers['word_count']: [r['word_count'] if ok else 'N/A' for r, ok in zip(rows, succeeded)],
+            headers['key_skills']: [', '.join(r['key_skills']) if ok else 'N/A' for r, ok in zip(rows, succeeded)],
+            headers['processing_time']: [r['processing_time'] if ok else 'N/A' for r, ok in zip(rows, succeeded)],
+            headers['status']: [r['status'] for r in rows]
+        }
+        
+        # Error column only appears when at least one resume failed
+        if not all(succeeded):
+            columns[headers['error']] = [
+                np.nan if ok else r.get('error', 'Unknown error') for r, ok in zip(rows, succeeded)
+            ]
+        
+        return pd.DataFrame(columns)
+    
+    def _open_excel_writer(self, filename: str) -> pd.ExcelWriter:
+        """Open an Excel writer, preferring the faster xlsxwriter engine when it is installed."""
+        # No constant_memory mode: pandas writes cells column by column, and that
+        # mode silently drops writes to rows it has already flushed
+        try:
+            import xlsxwriter  # noqa: F401
+        except ImportError:
+            return pd.ExcelWriter(filename, engine='openpyxl')
+        
+        return pd.ExcelWriter(filename, engine='xlsxwriter')
+    
     def _export_to_excel(self, results: Dict[str, Any], timestamp: str) -> Tuple[bool, str]:
         """Export results to Excel format."""
         try:
             # Create main results DataFrame
-            results_data = []
-            for result in results['results']:
-                if result['status'] == 'success':
-                    results_data.append({
-                        'Filename': result['filename'],
-                        'Similarity Score (%)': result['similarity_score'],
-                        'Word Count': result['word_count'],
-                        'Key Skills': ', '.join(result['key_skills']),
-                        'Processing Time (s)': result['processing_time'],
-                        'Status': result['status']
-                    })
-                else:
-                    results_data.append({
-                        'Filename': result['filename'],
-                        'Similarity Score (%)': 'N/A',
-                        'Word Count': 'N/A',
-                        'Key Skills': 'N/A',
-                        'Processing Time (s)': 'N/A',
-                        'Status': result['status'],
-                        'Error': result.get('error', 'Unknown error')
-                    })
+            results_df = self._build_export_frame(results, EXCEL_EXPORT_COLUMNS)
             
             # Create summary DataFrame
             summary_data = [{
@@ -378,8 +668,8 @@ class BulkResumeProcessor:
             
             # Export to Excel
             filename = f"bulk_resume_analysis_{timestamp}.xlsx"
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                pd.DataFrame(results_data).to_excel(writer, sheet_name='Results', index=False)
+            with self._open_excel_writer(filename) as writer:
+                results_df.to_excel(writer, sheet_name='Results', index=False)
                 pd.DataFrame(summary_data).to_excel(writer, sheet_name='Summary', index=False)
                 pd.DataFrame(dist_data).to_excel(writer, sheet_name='Score Distribution', index=False)
             
@@ -392,30 +682,9 @@ class BulkResumeProcessor:
         """Export results to CSV format."""
         try:
             # Create results DataFrame
-            results_data = []
-            for result in results['results']:
-                if result['status'] == 'success':
-                    results_data.append({
-                        'filename': result['filename'],
-                        'similarity_score': result['similarity_score'],
-                        'word_count': result['word_count'],
-                        'key_skills': ', '.join(result['key_skills']),
-                        'processing_time': result['processing_time'],
-                        'status': result['status']
-                    })
-                else:
-                    results_data.append({
-                        'filename': result['filename'],
-                        'similarity_score': 'N/A',
-                        'word_count': 'N/A',
-                        'key_skills': 'N/A',
-                        'processing_time': 'N/A',
-                        'status': result['status'],
-                        'error': result.get('error', 'Unknown error')
-                    })
+            df = self._build_export_frame(results, CSV_EXPORT_COLUMNS)
             
             filename = f"bulk_resume_analysis_{timestamp}.csv"
-            df = pd.DataFrame(results_data)
             df.to_csv(filename, index=False)
             
             return True, filename
@@ -435,10 +704,13 @@ class BulkResumeProcessor:
     
     def get_top_candidates(self, top_n: int = 10) -> List[Dict[str, Any]]:
         """Get top N candidates by similarity score."""
-        successful_results = [r for r in self.bulk_results if r['status'] == 'success']
-        return sorted(successful_results, key=lambda x: x['similarity_score'], reverse=True)[:top_n]
+        self._ensure_indexed()
+        top = self._successful_df.nlargest(top_n, 'similarity_score', keep='first')
+        return [self.bulk_results[i] for i in top.index]
     
     def get_candidates_by_score_range(self, min_score: float, max_score: float) -> List[Dict[str, Any]]:
         """Get candidates within a specific score range."""
-        successful_results = [r for r in self.bulk_results if r['status'] == 'success']
-        return [r for r in successful_results if min_score <= r['similarity_score'] <= max_score]
+        self._ensure_indexed()
+        scores = self._success_scores
+        matches = np.flatnonzero((scores >= min_score) & (scores <= max_score))
+        return [self._successful_results[i] for i in matches]
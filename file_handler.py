@@ -3,15 +3,147 @@ File handling module for resume-job description comparison.
 Handles file uploads and text extraction from various file formats.
 """
 
+import hashlib
 import logging
+import mmap
+import multiprocessing
 import os
-from typing import Dict, Optional, Tuple, Union
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from typing import Dict, Iterator, Optional, Tuple, Union
 from pathlib import Path
 
+try:
+    from lxml import etree
+except ImportError:
+    import xml.etree.ElementTree as etree
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import chardet
+except ImportError:
+    chardet = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Below this many files, process start-up costs more than parallel extraction saves
+PARALLEL_BATCH_MIN_FILES = 10
+
+# WordprocessingML tags read when streaming DOCX text
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_P = _W_NS + 'p'
+_W_T = _W_NS + 't'
+_W_TAB = _W_NS + 'tab'
+_W_BR = _W_NS + 'br'
+_W_CR = _W_NS + 'cr'
+# Subtrees whose content is not document text: paragraph properties (their w:tab
+# elements are tab-stop definitions) and the fallback copy of text-box content
+_DOCX_SKIPPED_TAGS = frozenset({
+    _W_NS + 'pPr',
+    '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback',
+})
+
+
+# Text files smaller than this are read directly; larger ones are memory-mapped
+TXT_MMAP_MIN_SIZE = 8 * 1024
+
+# Bytes inspected by chardet when a text file is not valid UTF-8
+CHARDET_SAMPLE_SIZE = 64 * 1024
+
+# Below this confidence chardet's guess loses to cp1252, the usual non-UTF-8 encoding
+# of English resumes; short samples such as "na\xefve" are often misdetected
+CHARDET_MIN_CONFIDENCE = 0.3
+
+# Extracted text is cached on disk here, one file per file type and content hash; anchored to the
+# package directory so the location does not depend on the working directory
+EXTRACT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'temp', 'extract_cache')
+
+# Bump whenever extraction output changes, so text from an older extractor is not served
+EXTRACTOR_VERSION = 2
+
+# The cache holds resume text, so it is kept small and short-lived
+EXTRACT_CACHE_MAX_FILES = 500
+EXTRACT_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds
+
+
+def _hash_content(data) -> str:
+    """Hash file contents for cache keys, preferring the much faster xxHash when installed."""
+    if xxhash is not None:
+        return 'xxh3_' + xxhash.xxh3_64_hexdigest(data)
+    return 'sha256_' + hashlib.sha256(data).hexdigest()
+
+
+@lru_cache(maxsize=128)
+def _load_cached_extract(cache_path: str) -> str:
+    """Read a cached extraction, keeping the hottest ones in memory; raises OSError on a miss."""
+    with open(cache_path, 'rb') as file:
+        return file.read().decode('utf-8')
+
+
+def _extract_file(file_path: str, extract_cache_dir: Optional[str], max_file_size: int) -> Tuple[bool, str]:
+    """
+    Extract text from one file; module-level so it can run in a worker process.
+    
+    The worker builds its own FileHandler, so the calling handler's cache
+    directory and size limit are passed in and applied to it.
+    """
+    try:
+        handler = FileHandler()
+        handler.extract_cache_dir = extract_cache_dir
+        handler.max_file_size = max_file_size
+        return handler.extract_text(file_path)
+    except Exception as e:
+        return False, f"Error extracting text: {str(e)}"
+
+
+def extract_bytes_worker(data: bytes, file_ext: str) -> Tuple[bool, str, float]:
+    """
+    Extract text from in-memory file contents and time the extraction.
+    
+    Lives in this lightweight module so worker processes do not have to import
+    the app's model and UI dependencies.
+    
+    Args:
+        data (bytes): Raw file contents
+        file_ext (str): File extension including the dot
+        
+    Returns:
+        Tuple[bool, str, float]: (success, text_or_error_message, extraction_time)
+    """
+    start_time = time.perf_counter_ns()
+    
+    try:
+        success, text_or_error = FileHandler().extract_text_from_bytes(data, file_ext)
+    except Exception as e:
+        success, text_or_error = False, f"Error extracting text: {str(e)}"
+    
+    return success, text_or_error, (time.perf_counter_ns() - start_time) / 1e9
+
+
+def extraction_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Create a process pool for extraction workers.
+    
+    Workers start from a forkserver where the platform has one, so a multithreaded
+    parent process (Streamlit, torch) is never forked directly.
+    """
+    try:
+        context = multiprocessing.get_context('forkserver')
+    except ValueError:
+        context = None
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+
+
 class FileHandler:
     """
     A class for handling file uploads and text extraction from various formats.
@@ -26,7 +158,12 @@ class FileHandler:
             '.txt': 'text/plain'
         }
         
+        self._supported_exts = frozenset(self.supported_formats)
+        
         self.max_file_size = 10 * 1024 * 1024  # 10MB
+        
+        # Extracted text keyed by file content hash; set to None to disable caching
+        self.extract_cache_dir = EXTRACT_CACHE_DIR
     
     def validate_file(self, file_path: str, file_type: Optional[str] = None) -> Tuple[bool, str]:
         """
@@ -40,18 +177,18 @@ class FileHandler:
             Tuple[bool, str]: (is_valid, error_message)
         """
         try:
-            # Check if file exists
-            if not os.path.exists(file_path):
+            # Check existence and size with a single stat call
+            try:
+                file_size = os.stat(file_path).st_size
+            except FileNotFoundError:
                 return False, f"File not found: {file_path}"
             
-            # Check file size
-            file_size = os.path.getsize(file_path)
             if file_size > self.max_file_size:
                 return False, f"File too large: {file_size / (1024*1024):.1f}MB (max: {self.max_file_size / (1024*1024)}MB)"
             
             # Check file extension
-            file_ext = Path(file_path).suffix.lower()
-            if file_ext not in self.supported_formats:
+            file_ext = os.path.splitext(file_path)[1].lower()
+            if file_ext not in self._supported_exts:
                 return False, f"Unsupported file format: {file_ext}. Supported: {', '.join(self.supported_formats.keys())}"
             
             # Check file type if specified
@@ -75,35 +212,23 @@ class FileHandler:
             Tuple[bool, Union[str, str]]: (success, text_or_error_message)
         """
         try:
-            import pdfplumber
-            
             # Validate file
             is_valid, error_msg = self.validate_file(file_path, '.pdf')
             if not is_valid:
                 return False, error_msg
             
-            text = ""
-            with pdfplumber.open(file_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-                        logger.info(f"Processed page {page_num + 1}")
-                    except Exception as e:
-                        logger.warning(f"Error processing page {page_num + 1}: {str(e)}")
-                        continue
+            text = self._read_pdf_text(file_path)
             
             if not text.strip():
                 return False, "No text could be extracted from the PDF"
             
-            logger.info(f"Successfully extracted {len(text)} characters from PDF")
+            logger.info("Successfully extracted %d characters from PDF", len(text))
             return True, text.strip()
             
         except ImportError:
-            return False, "pdfplumber library not installed. Please install it using: pip install pdfplumber"
+            return False, "No PDF library installed. Please install one using: pip install pymupdf (or pdfplumber)"
         except Exception as e:
-            logger.error(f"Error extracting text from PDF {file_path}: {str(e)}")
+            logger.error("Error extracting text from PDF %s: %s", file_path, e)
             return False, f"Error extracting text: {str(e)}"
     
     def extract_text_from_docx(self, file_path: str) -> Tuple[bool, Union[str, str]]:
@@ -117,38 +242,21 @@ class FileHandler:
             Tuple[bool, Union[str, str]]: (success, text_or_error_message)
         """
         try:
-            from docx import Document
-            
             # Validate file
             is_valid, error_msg = self.validate_file(file_path, '.docx')
             if not is_valid:
                 return False, error_msg
             
-            doc = Document(file_path)
-            text = ""
-            
-            # Extract text from paragraphs
-            for para in doc.paragraphs:
-                if para.text.strip():
-                    text += para.text + "\n"
-            
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            text += cell.text + "\n"
+            text = self._read_docx_text(file_path)
             
             if not text.strip():
                 return False, "No text could be extracted from the DOCX file"
             
-            logger.info(f"Successfully extracted {len(text)} characters from DOCX")
+            logger.info("Successfully extracted %d characters from DOCX", len(text))
             return True, text.strip()
             
-        except ImportError:
-            return False, "python-docx library not installed. Please install it using: pip install python-docx"
         except Exception as e:
-            logger.error(f"Error extracting text from DOCX {file_path}: {str(e)}")
+            logger.error("Error extracting text from DOCX %s: %s", file_path, e)
             return False, f"Error extracting text: {str(e)}"
     
     def extract_text_from_txt(self, file_path: str) -> Tuple[bool, Union[str, str]]:
@@ -167,35 +275,199 @@ class FileHandler:
             if not is_valid:
                 return False, error_msg
             
-            # Read text file with proper encoding detection
-            encodings = ['utf-8', 'latin-1', 'cp1252']
-            text = ""
+            # Read the file once; larger files are decoded straight from a memory map
+            with open(file_path, 'rb') as file:
+                if os.fstat(file.fileno()).st_size < TXT_MMAP_MIN_SIZE:
+                    text = self._decode_text(file.read())
+                else:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        text = self._decode_text(mapped)
+            
+            text = self._normalize_newlines(text)
+            
+            if not text.strip():
+                return False, "No text could be extracted from the file"
+            
+            logger.info("Successfully extracted %d characters from text file", len(text))
+            return True, text.strip()
+            
+        except Exception as e:
+            logger.error("Error extracting text from text file %s: %s", file_path, e)
+            return False, f"Error extracting text: {str(e)}"
+    
+    def extract_text_from_bytes(self, data: bytes, file_ext: str) -> Tuple[bool, Union[str, str]]:
+        """
+        Extract text from in-memory file contents without writing them to disk.
+        
+        Args:
+            data (bytes): Raw file contents
+            file_ext (str): File extension including the dot (e.g. '.pdf')
             
-            for encoding in encodings:
+        Returns:
+            Tuple[bool, Union[str, str]]: (success, text_or_error_message)
+        """
+        file_ext = file_ext.lower()
+        
+        if file_ext not in self.supported_formats:
+            return False, f"Unsupported file format: {file_ext}"
+        
+        if len(data) > self.max_file_size:
+            return False, f"File too large: {len(data) / (1024*1024):.1f}MB (max: {self.max_file_size / (1024*1024)}MB)"
+        
+        try:
+            if file_ext == '.pdf':
                 try:
-                    with open(file_path, 'r', encoding=encoding) as file:
-                        text = file.read()
-                    break
-                except UnicodeDecodeError:
-                    continue
-                except Exception as e:
-                    logger.warning(f"Error reading with encoding {encoding}: {str(e)}")
-                    continue
+                    text = self._read_pdf_text(data)
+                except ImportError:
+                    return False, "No PDF library installed. Please install one using: pip install pymupdf (or pdfplumber)"
+            elif file_ext == '.docx':
+                text = self._read_docx_text(BytesIO(data))
+            else:
+                text = self._normalize_newlines(self._decode_text(data))
             
             if not text.strip():
                 return False, "No text could be extracted from the file"
             
-            logger.info(f"Successfully extracted {len(text)} characters from text file")
+            logger.info("Successfully extracted %d characters from %s data", len(text), file_ext)
             return True, text.strip()
             
         except Exception as e:
-            logger.error(f"Error extracting text from text file {file_path}: {str(e)}")
+            logger.error("Error extracting text from %s data: %s", file_ext, e)
             return False, f"Error extracting text: {str(e)}"
     
+    def _read_pdf_text(self, source: Union[str, bytes]) -> str:
+        """
+        Read the text of every page from a PDF path or raw PDF bytes.
+        
+        Uses PyMuPDF (native MuPDF) when installed, falling back to pdfplumber.
+        Raises ImportError if neither library is available.
+        """
+        try:
+            import pymupdf
+        except ImportError:
+            pymupdf = None
+        
+        chunks = []
+        
+        if pymupdf is not None:
+            if isinstance(source, bytes):
+                doc = pymupdf.open(stream=source, filetype="pdf")
+            else:
+                doc = pymupdf.open(source)
+            with doc:
+                for page_num, page in enumerate(doc):
+                    try:
+                        # MuPDF already ends each page with a newline
+                        page_text = page.get_text("text").rstrip("\n")
+                        if page_text:
+                            chunks.append(page_text)
+                    except Exception as e:
+                        logger.warning("Error processing page %d: %s", page_num + 1, e)
+                        continue
+                logger.info("Processed %d pages", doc.page_count)
+            return "\n".join(chunks)
+        
+        import pdfplumber
+        
+        with pdfplumber.open(BytesIO(source) if isinstance(source, bytes) else source) as pdf:
+            for page_num, page in enumerate(pdf.pages):
+                try:
+                    page_text = page.extract_text()
+                    if page_text:
+                        chunks.append(page_text)
+                except Exception as e:
+                    logger.warning("Error processing page %d: %s", page_num + 1, e)
+                    continue
+            logger.info("Processed %d pages", len(pdf.pages))
+        return "\n".join(chunks)
+    
+    def _read_docx_text(self, source) -> str:
+        """
+        Read paragraph text, including table cells, from a DOCX path or file-like object.
+        
+        Streams word/document.xml straight out of the archive instead of building
+        a full python-docx document model.
+        """
+        chunks = []
+        # Text of the paragraphs currently open; text boxes can nest paragraphs
+        open_paragraphs = []
+        # Depth inside subtrees that hold no document text
+        skip_depth = 0
+        
+        with zipfile.ZipFile(source) as archive, archive.open('word/document.xml') as document_xml:
+            for event, element in etree.iterparse(document_xml, events=('start', 'end')):
+                tag = element.tag
+                
+                if tag in _DOCX_SKIPPED_TAGS:
+                    skip_depth += 1 if event == 'start' else -1
+                    continue
+                if skip_depth:
+                    continue
+                
+                if event == 'start':
+                    if tag == _W_P:
+                        open_paragraphs.append([])
+                    continue
+                
+                if not open_paragraphs:
+                    continue
+                
+                if tag == _W_T:
+                    if element.text:
+                        open_paragraphs[-1].append(element.text)
+                elif tag == _W_TAB:
+                    open_paragraphs[-1].append('\t')
+                elif tag in (_W_BR, _W_CR):
+                    open_paragraphs[-1].append('\n')
+                elif tag == _W_P:
+                    para_text = ''.join(open_paragraphs.pop())
+                    if para_text.strip():
+                        chunks.append(para_text)
+                    # Drop the parsed subtree to keep memory flat on long documents
+                    element.clear()
+        
+        return "\n".join(chunks)
+    
+    def _normalize_newlines(self, text: str) -> str:
+        """Translate Windows and old Mac line endings, as text-mode reads do."""
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+    
+    def _decode_text(self, data) -> str:
+        """
+        Decode plain-text bytes (or any bytes-like object such as an mmap).
+        
+        UTF-8 is tried first; otherwise the encoding is detected with chardet
+        when installed. A low-confidence guess is only used if the text is not
+        valid cp1252, and latin-1, which accepts any byte, is the last resort.
+        """
+        try:
+            return str(data, 'utf-8')
+        except UnicodeDecodeError:
+            pass
+        
+        if chardet is not None:
+            detected = chardet.detect(bytes(data[:CHARDET_SAMPLE_SIZE]))
+            encoding = detected['encoding']
+            if encoding and (detected['confidence'] or 0) < CHARDET_MIN_CONFIDENCE:
+                try:
+                    return str(data, 'cp1252')
+                except UnicodeDecodeError:
+                    pass
+            if encoding:
+                try:
+                    return str(data, encoding, 'replace')
+                except LookupError:
+                    pass
+        
+        return str(data, 'latin-1')
+    
     def extract_text(self, file_path: str) -> Tuple[bool, Union[str, str]]:
         """
         Extract text from a file based on its extension.
         
+        Successful extractions of valid files are cached by file type, content
+        and extractor version, so re-reading an unchanged file skips parsing entirely.
+        
         Args:
             file_path (str): Path to the file
             
@@ -205,13 +477,86 @@ class FileHandler:
         file_ext = Path(file_path).suffix.lower()
         
         if file_ext == '.pdf':
-            return self.extract_text_from_pdf(file_path)
+            extractor = self.extract_text_from_pdf
         elif file_ext == '.docx':
-            return self.extract_text_from_docx(file_path)
+            extractor = self.extract_text_from_docx
         elif file_ext == '.txt':
-            return self.extract_text_from_txt(file_path)
+            extractor = self.extract_text_from_txt
         else:
             return False, f"Unsupported file format: {file_ext}"
+        
+        # Reject missing or oversized files before reading them to compute a cache key
+        is_valid, error_msg = self.validate_file(file_path, file_ext)
+        if not is_valid:
+            return False, error_msg
+        
+        cache_path = None
+        if self.extract_cache_dir:
+            try:
+                # Same bytes with another extension go through another extractor, so get their own entry
+                cache_path = os.path.join(
+                    self.extract_cache_dir,
+                    f"v{EXTRACTOR_VERSION}_{file_ext.lstrip('.')}_{self._content_key(file_path)}.txt"
+                )
+            except OSError:
+                # Unreadable - let the extractor report it
+                pass
+        
+        if cache_path:
+            try:
+                return True, _load_cached_extract(cache_path)
+            except OSError:
+                pass
+        
+        success, text_or_error = extractor(file_path)
+        
+        if success and cache_path:
+            self._store_cached_extract(cache_path, text_or_error)
+        
+        return success, text_or_error
+    
+    def _content_key(self, file_path: str) -> str:
+        """Hash a file's contents through a read-only memory map."""
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return _hash_content(b'')
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return _hash_content(mapped)
+    
+    def _store_cached_extract(self, cache_path: str, text: str) -> None:
+        """Write an extraction to the cache; failures only cost a future cache miss."""
+        try:
+            os.makedirs(self.extract_cache_dir, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as file:
+                file.write(text.encode('utf-8'))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Could not cache extracted text at %s: %s", cache_path, e)
+            return
+        
+        self._prune_extract_cache()
+    
+    def _prune_extract_cache(self) -> None:
+        """Delete cached extractions past the age limit, then the oldest beyond the size limit."""
+        try:
+            with os.scandir(self.extract_cache_dir) as entries:
+                cached = [(entry.stat().st_mtime, entry.path) for entry in entries if entry.is_file()]
+        except OSError:
+            return
+        
+        cached.sort()
+        expired_before = time.time() - EXTRACT_CACHE_MAX_AGE
+        excess = len(cached) - EXTRACT_CACHE_MAX_FILES
+        
+        for index, (mtime, path) in enumerate(cached):
+            if mtime >= expired_before and index >= excess:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
     
     def get_file_info(self, file_path: str) -> Dict[str, any]:
         """
@@ -263,9 +608,9 @@ class FileHandler:
             if output_dir and not os.path.exists(output_dir):
                 os.makedirs(output_dir)
             
-            # Save text
-            with open(output_path, 'w', encoding='utf-8') as file:
-                file.write(text)
+            # Save text: encode once and hand the bytes to a 64KB buffered writer
+            with open(output_path, 'wb', buffering=65536) as file:
+                file.write(text.encode('utf-8'))
             
             logger.info(f"Text saved to {output_path}")
             return True, ""
@@ -292,14 +637,35 @@ class FileHandler:
             'results': {}
         }
         
-        for file_path in file_paths:
+        for file_path, file_result in self.iter_process(file_paths, output_dir):
+            if file_result['status'] == 'success':
+                results['successful'] += 1
+            else:
+                results['failed'] += 1
+            results['results'][file_path] = file_result
+        
+        return results
+    
+    def iter_process(self, file_paths: list, output_dir: str = None) -> Iterator[Tuple[str, Dict[str, any]]]:
+        """
+        Extract text from files one at a time, yielding a result per file.
+        
+        Only a preview of each text is kept, and the process pool extracts at most
+        a small window of files ahead of the consumer, so memory stays flat however
+        many files are processed. Callers that need running totals can stream this
+        instead of waiting for batch_process_files.
+        
+        Args:
+            file_paths (list): List of file paths to process
+            output_dir (str, optional): Directory to save extracted text files
+            
+        Yields:
+            Tuple[str, Dict[str, any]]: (file_path, per-file result)
+        """
+        for file_path, (success, text_or_error) in zip(file_paths, self._iter_extract_files(file_paths)):
             try:
-                # Extract text
-                success, text_or_error = self.extract_text(file_path)
-                
                 if success:
-                    results['successful'] += 1
-                    results['results'][file_path] = {
+                    file_result = {
                         'status': 'success',
                         'text_length': len(text_or_error),
                         'text_preview': text_or_error[:200] + "..." if len(text_or_error) > 200 else text_or_error
@@ -312,26 +678,46 @@ class FileHandler:
                         save_success, save_error = self.save_text_to_file(text_or_error, output_path)
                         
                         if save_success:
-                            results['results'][file_path]['saved_to'] = output_path
+                            file_result['saved_to'] = output_path
                         else:
-                            results['results'][file_path]['save_error'] = save_error
+                            file_result['save_error'] = save_error
                     
                 else:
-                    results['failed'] += 1
-                    results['results'][file_path] = {
+                    file_result = {
                         'status': 'failed',
                         'error': text_or_error
                     }
                     
             except Exception as e:
-                results['failed'] += 1
-                results['results'][file_path] = {
+                file_result = {
                     'status': 'error',
                     'error': str(e)
                 }
                 logger.error(f"Error processing file {file_path}: {str(e)}")
+            
+            # Release the full text before extracting the next file
+            del text_or_error
+            yield file_path, file_result
+    
+    def _iter_extract_files(self, file_paths: list) -> Iterator[Tuple[bool, str]]:
+        """Yield extraction results in input order, using a process pool for larger batches."""
+        if len(file_paths) < PARALLEL_BATCH_MIN_FILES:
+            for file_path in file_paths:
+                yield _extract_file(file_path, self.extract_cache_dir, self.max_file_size)
+            return
         
-        return results
+        max_workers = min(os.cpu_count() or 1, len(file_paths))
+        # executor.map would submit every file up front and hold each finished text
+        # until it is consumed; a sliding window keeps that bounded
+        max_in_flight = 2 * max_workers
+        with extraction_pool(max_workers) as executor:
+            in_flight = deque()
+            for file_path in file_paths:
+                if len(in_flight) >= max_in_flight:
+                    yield in_flight.popleft().result()
+                in_flight.append(executor.submit(_extract_file, file_path, self.extract_cache_dir, self.max_file_size))
+            while in_flight:
+                yield in_flight.popleft().result()
     
     def cleanup_temp_files(self, temp_files: list) -> None:
         """
@@ -8,17 +8,37 @@ import subprocess
 import sys
 import os
 import platform
+import hashlib
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+# Skip pip's online self-version check and .pyc writes during installation
+COMMAND_ENV = {**os.environ, 'PIP_DISABLE_PIP_VERSION_CHECK': '1', 'PYTHONDONTWRITEBYTECODE': '1'}
+
+# Install artifacts live under the package's temp directory, wherever the script is run from
+PACKAGE_TEMP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'temp')
+
+# Trimmed spaCy pipeline saved at install time; TextProcessor loads it when present
+SPACY_FAST_MODEL_DIR = os.path.join(PACKAGE_TEMP_DIR, 'en_core_web_sm_fast')
+
+# Records the requirements.txt hash of the last fully validated install
+INSTALL_SENTINEL = os.path.join(PACKAGE_TEMP_DIR, '.install_ok')
 
 def run_command(command, description):
-    """Run a command and handle errors."""
+    """Run a command (argument list), streaming its output and handling errors."""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        # stdout streams straight to the terminal; only stderr is kept for error reporting
+        subprocess.run(command, check=True, stdout=None, stderr=subprocess.PIPE, env=COMMAND_ENV)
         print(f"✅ {description} completed successfully")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed:")
-        print(f"Error: {e.stderr}")
+        print(f"Error: {e.stderr[-8192:].decode(errors='replace')}")
+        return False
+    except OSError as e:
+        print(f"❌ {description} failed:")
+        print(f"Error: {e}")
         return False
 
 def check_python_version():
@@ -37,25 +57,79 @@ def install_requirements():
     """Install required packages."""
     print("📦 Installing required packages...")
     
-    # Upgrade pip first
-    if not run_command("python -m pip install --upgrade pip", "Upgrading pip"):
-        return False
+    # Prefer uv's much faster parallel resolver and installer when available
+    if shutil.which("uv"):
+        return run_command(
+            ["uv", "pip", "install", "--python", sys.executable, "-r", "requirements.txt"],
+            "Installing requirements with uv"
+        )
     
-    # Install requirements
-    if not run_command("pip install -r requirements.txt", "Installing requirements"):
+    # Upgrade pip first, unless it is already recent
+    if not pip_is_recent():
+        if not run_command([sys.executable, "-m", "pip", "install", "--upgrade", "pip"], "Upgrading pip"):
+            return False
+    
+    # Install requirements, preferring prebuilt wheels over source builds
+    if not run_command([sys.executable, "-m", "pip", "install", "--prefer-binary", "-r", "requirements.txt"],
+                       "Installing requirements"):
         return False
     
     return True
 
+def pip_is_recent(min_major=23):
+    """Check whether the installed pip is at least the given major version."""
+    try:
+        from importlib.metadata import version
+        return int(version("pip").split(".")[0]) >= min_major
+    except Exception:
+        return False
+
 def download_spacy_model():
     """Download the required spaCy model."""
     print("📚 Downloading spaCy model...")
     
-    if not run_command("python -m spacy download en_core_web_sm", "Downloading spaCy model"):
+    if not run_command([sys.executable, "-m", "spacy", "download", "en_core_web_sm"], "Downloading spaCy model"):
         return False
     
     return True
 
+def _try_import(module):
+    """
+    Import a module in a fresh interpreter, returning (module, error).
+    
+    A subprocess per module lets the imports run truly in parallel; importing
+    heavy packages concurrently on threads of one interpreter can deadlock
+    on shared submodule import locks.
+    """
+    result = subprocess.run([sys.executable, '-c', f'import {module}'], capture_output=True, text=True)
+    if result.returncode == 0:
+        return module, None
+    
+    stderr_lines = result.stderr.strip().splitlines()
+    return module, stderr_lines[-1] if stderr_lines else f"exit code {result.returncode}"
+
+def _requirements_hash():
+    """Hash requirements.txt so validation reruns whenever it changes."""
+    with open('requirements.txt', 'rb') as f:
+        return hashlib.md5(f.read()).hexdigest()
+
+def is_already_validated():
+    """Check whether imports and the spaCy model were validated for the current requirements."""
+    try:
+        with open(INSTALL_SENTINEL) as f:
+            return f.read().strip() == _requirements_hash()
+    except OSError:
+        return False
+
+def mark_validated():
+    """Record that the current requirements passed validation."""
+    try:
+        os.makedirs(os.path.dirname(INSTALL_SENTINEL), exist_ok=True)
+        with open(INSTALL_SENTINEL, 'w') as f:
+            f.write(_requirements_hash())
+    except OSError as e:
+        print(f"⚠️ Could not record successful validation: {e}")
+
 def test_imports():
     """Test if all required modules can be imported."""
     print("🧪 Testing imports...")
@@ -75,12 +149,15 @@ def test_imports():
     
     failed_imports = []
     
-    for module in required_modules:
-        try:
-            __import__(module)
+    # Import the heavy modules concurrently, then report in a stable order
+    with ThreadPoolExecutor(max_workers=min(8, len(required_modules))) as executor:
+        results = list(executor.map(_try_import, required_modules))
+    
+    for module, error in results:
+        if error is None:
             print(f"✅ {module}")
-        except ImportError as e:
-            print(f"❌ {module}: {e}")
+        else:
+            print(f"❌ {module}: {error}")
             failed_imports.append(module)
     
     if failed_imports:
@@ -101,12 +178,45 @@ def test_spacy_model():
         # Test with a simple sentence
         doc = nlp("This is a test sentence.")
         print(f"✅ spaCy model working. Processed sentence with {len(doc)} tokens")
+        
+        build_fast_spacy_model(nlp)
         return True
         
     except Exception as e:
         print(f"❌ spaCy model test failed: {e}")
         return False
 
+def build_fast_spacy_model(nlp):
+    """
+    Save a trimmed copy of the spaCy pipeline for the app to load at startup.
+    
+    The app needs lemmas, stop words, entities and sentence boundaries but no
+    dependency parse, so the parser is swapped for the much cheaper sentence
+    recognizer. Skipped when the saved copy is newer than the installed model.
+    """
+    try:
+        import spacy
+        
+        upstream_path = spacy.util.get_package_path("en_core_web_sm")
+        if (os.path.isdir(SPACY_FAST_MODEL_DIR) and
+                os.path.getmtime(SPACY_FAST_MODEL_DIR) >= os.path.getmtime(upstream_path)):
+            print("✅ Trimmed spaCy pipeline is up to date")
+            return True
+        
+        if "parser" in nlp.pipe_names and "senter" in nlp.component_names:
+            nlp.enable_pipe("senter")
+            nlp.remove_pipe("parser")
+        
+        os.makedirs(os.path.dirname(SPACY_FAST_MODEL_DIR), exist_ok=True)
+        nlp.to_disk(SPACY_FAST_MODEL_DIR)
+        print(f"✅ Saved trimmed spaCy pipeline to {SPACY_FAST_MODEL_DIR}")
+        return True
+        
+    except Exception as e:
+        # The app falls back to the installed model, so this is not fatal
+        print(f"⚠️ Could not save trimmed spaCy pipeline: {e}")
+        return False
+
 def create_directories():
     """Create necessary directories."""
     print("📁 Creating directories...")
@@ -127,7 +237,7 @@ def run_demo():
     """Run a quick demo to test the installation."""
     print("🚀 Running demo...")
     
-    if not run_command("python demo.py", "Running demo"):
+    if not run_command([sys.executable, "demo.py"], "Running demo"):
         print("⚠️ Demo failed, but installation might still be successful")
         return True
     
@@ -159,21 +269,29 @@ def main():
         print("\n❌ Failed to download spaCy model.")
         sys.exit(1)
     
-    # Test imports
-    if not test_imports():
-        print("\n❌ Some modules failed to import.")
-        sys.exit(1)
+    already_validated = is_already_validated()
     
-    # Test spaCy model
-    if not test_spacy_model():
-        print("\n❌ spaCy model test failed.")
-        sys.exit(1)
+    if already_validated:
+        print("✅ Imports and spaCy model already validated for these requirements")
+    else:
+        # Test imports
+        if not test_imports():
+            print("\n❌ Some modules failed to import.")
+            sys.exit(1)
+        
+        # Test spaCy model
+        if not test_spacy_model():
+            print("\n❌ spaCy model test failed.")
+            sys.exit(1)
     
     # Create directories
     if not create_directories():
         print("\n❌ Failed to create directories.")
         sys.exit(1)
     
+    if not already_validated:
+        mark_validated()
+    
     # Run demo
     print("\n🎯 Installation completed successfully!")
     print("Running demo to verify everything works...")
@@ -4,10 +4,14 @@ Implements TF-IDF and BERT-based similarity calculations.
 """
 
 import logging
+import hashlib
+import copy
+import threading
 import numpy as np
+from collections import OrderedDict
 from typing import Dict, Tuple, Optional, Union, List
+from sklearn.base import clone
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import torch
 import torch.nn.functional as F
 
@@ -15,6 +19,53 @@ import torch.nn.functional as F
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Pretrained BERT checkpoint; also part of the embedding cache key
+BERT_MODEL_NAME = 'bert-base-uncased'
+
+# Number of embeddings kept for reuse across calls
+EMBEDDING_CACHE_SIZE = 1000
+
+# Optional JIT-compiled cosine kernel; falls back to NumPy when numba is not installed
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _cosine_scores_numpy(resume_matrix: np.ndarray, job_desc_vector: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Cosine similarity of every row against one vector, plus the row norms."""
+    resume_norms = np.sqrt(np.einsum('ij,ij->i', resume_matrix, resume_matrix))
+    job_desc_norm = max(np.sqrt(np.vdot(job_desc_vector, job_desc_vector)), 1e-8)
+    scores = (resume_matrix @ job_desc_vector) / (np.maximum(resume_norms, 1e-8) * job_desc_norm)
+    return scores, resume_norms
+
+
+if njit is not None:
+    # Serial on purpose: numba's default workqueue threading layer aborts the process
+    # when parallel kernels are entered from several threads (one per Streamlit session)
+    @njit(fastmath=True, cache=True)
+    def _cosine_scores(resume_matrix, job_desc_vector):
+        """Cosine similarity of every row against one vector, plus the row norms."""
+        n_rows, n_dims = resume_matrix.shape
+        scores = np.empty(n_rows, dtype=np.float32)
+        resume_norms = np.empty(n_rows, dtype=np.float32)
+        job_desc_norm = max(np.sqrt(np.dot(job_desc_vector, job_desc_vector)), 1e-8)
+        
+        # One fused pass per row computes both the dot product and the squared norm
+        for i in range(n_rows):
+            dot = 0.0
+            sq_norm = 0.0
+            for j in range(n_dims):
+                dot += resume_matrix[i, j] * job_desc_vector[j]
+                sq_norm += resume_matrix[i, j] * resume_matrix[i, j]
+            resume_norms[i] = np.sqrt(sq_norm)
+            scores[i] = dot / (max(resume_norms[i], 1e-8) * job_desc_norm)
+        
+        return scores, resume_norms
+else:
+    _cosine_scores = _cosine_scores_numpy
+
+
 class SimilarityCalculator:
     """
     A class for calculating similarity between resume and job description texts
@@ -42,6 +93,18 @@ class SimilarityCalculator:
         self.bert_model = None
         self.bert_tokenizer = None
         
+        # BERT embeddings keyed by model name, precision and content hash of the preprocessed text
+        self._embedding_cache = OrderedDict()
+        # The calculator is shared across Streamlit session threads
+        self._embedding_cache_lock = threading.Lock()
+        # Guards loading the model and swapping it for a reduced-precision copy
+        self._model_lock = threading.Lock()
+        
+        # Whether BERT runs with int8 Linear layers (CPU) or FP16 weights (GPU)
+        self.reduced_precision = False
+        # Precision the loaded model actually runs at: 'fp32', 'int8' or 'fp16'
+        self._bert_precision = 'fp32'
+        
         logger.info(f"SimilarityCalculator initialized on device: {self.device}")
     
     def calculate_tfidf_similarity(self, job_desc: str, resume: str) -> Dict[str, any]:
@@ -52,12 +115,27 @@ class SimilarityCalculator:
             job_desc (str): Job description text
             resume (str): Resume text
             
+        Returns:
+            Dict[str, any]: TF-IDF similarity results
+        """
+        return self.calculate_tfidf_similarity_precomputed(
+            self.encode_job_description(job_desc, use_bert=False), resume
+        )
+    
+    def calculate_tfidf_similarity_precomputed(self, encoded_job_desc: Dict[str, any], resume: str) -> Dict[str, any]:
+        """
+        Calculate TF-IDF similarity against an already encoded job description.
+        
+        Args:
+            encoded_job_desc (Dict[str, any]): Output of encode_job_description
+            resume (str): Resume text
+            
         Returns:
             Dict[str, any]: TF-IDF similarity results
         """
         try:
-            # Preprocess texts
-            processed_job_desc = self._preprocess_for_tfidf(job_desc)
+            # Preprocess resume (job description is already preprocessed)
+            processed_job_desc = encoded_job_desc['tfidf_text']
             processed_resume = self._preprocess_for_tfidf(resume)
             
             if not processed_job_desc or not processed_resume:
@@ -68,19 +146,25 @@ class SimilarityCalculator:
                     'error': 'Insufficient text for analysis'
                 }
             
-            # Create TF-IDF vectors
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform([processed_job_desc, processed_resume])
+            # Create TF-IDF vectors on a private copy; the calculator may be shared across sessions
+            vectorizer = clone(self.tfidf_vectorizer)
+            tfidf_matrix = vectorizer.fit_transform([processed_job_desc, processed_resume])
+            
+            # Densify both rows once; they serve the cosine and the feature breakdown
+            job_desc_tfidf = tfidf_matrix[0].toarray().ravel()
+            resume_tfidf = tfidf_matrix[1].toarray().ravel()
             
             # Calculate cosine similarity
-            similarity_score = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            similarity_score = float(
+                np.dot(job_desc_tfidf, resume_tfidf) /
+                np.sqrt(np.vdot(job_desc_tfidf, job_desc_tfidf) * np.vdot(resume_tfidf, resume_tfidf) + 1e-12)
+            )
             
             # Convert to percentage
             similarity_percentage = similarity_score * 100
             
             # Get feature names and their importance
-            feature_names = self.tfidf_vectorizer.get_feature_names_out()
-            job_desc_tfidf = tfidf_matrix[0].toarray()[0]
-            resume_tfidf = tfidf_matrix[1].toarray()[0]
+            feature_names = vectorizer.get_feature_names_out()
             
             # Find important features
             important_features = self._get_important_features(
@@ -109,6 +193,85 @@ class SimilarityCalculator:
                 'error': f'Calculation error: {str(e)}'
             }
     
+    def calculate_tfidf_similarity_batch(self, encoded_job_desc: Dict[str, any], 
+                                         resumes: List[str]) -> List[Dict[str, any]]:
+        """
+        Calculate TF-IDF similarity for many resumes against one encoded job description.
+        
+        The vocabulary and IDF weights are fitted once on the job description plus
+        all resumes. The vocabulary is uncapped (max_features is lifted), so no job
+        description term is pushed out by terms from a large batch. IDF weights
+        still reflect the whole batch rather than each pair: a resume's score
+        depends on which other resumes are in the batch and can differ from
+        calculate_tfidf_similarity for the same pair.
+        
+        Args:
+            encoded_job_desc (Dict[str, any]): Output of encode_job_description
+            resumes (List[str]): Resume texts
+            
+        Returns:
+            List[Dict[str, any]]: TF-IDF similarity results, one per resume
+        """
+        insufficient = {
+            'method': 'TF-IDF',
+            'similarity_score': 0.0,
+            'confidence': 'low',
+            'error': 'Insufficient text for analysis'
+        }
+        
+        processed_job_desc = encoded_job_desc['tfidf_text']
+        processed_resumes = [self._preprocess_for_tfidf(resume) for resume in resumes]
+        non_empty = [i for i, text in enumerate(processed_resumes) if text]
+        
+        if not processed_job_desc or not non_empty:
+            return [dict(insufficient) for _ in resumes]
+        
+        try:
+            # Fit once on the whole batch; rows come out L2-normalized. The single-pair
+            # feature cap would drop rare job description terms on larger batches
+            vectorizer = clone(self.tfidf_vectorizer).set_params(max_features=None)
+            tfidf_matrix = vectorizer.fit_transform(
+                [processed_job_desc] + [processed_resumes[i] for i in non_empty]
+            ).tocsr()
+            job_desc_row = tfidf_matrix[0]
+            resume_rows = tfidf_matrix[1:]
+            
+            # Cosine similarity of every resume in one sparse product
+            similarity_scores = (resume_rows @ job_desc_row.T).toarray().ravel()
+            
+            feature_names = vectorizer.get_feature_names_out()
+            job_desc_tfidf = job_desc_row.toarray()[0]
+            
+            results = [dict(insufficient) for _ in resumes]
+            for row, i in enumerate(non_empty):
+                similarity_score = float(similarity_scores[row])
+                similarity_percentage = similarity_score * 100
+                
+                # Only terms present in either text can be important features
+                resume_row = resume_rows[row]
+                feature_indices = np.union1d(job_desc_row.indices, resume_row.indices)
+                resume_tfidf = resume_row.toarray()[0]
+                
+                results[i] = {
+                    'method': 'TF-IDF',
+                    'similarity_score': round(similarity_percentage, 2),
+                    'raw_score': similarity_score,
+                    'confidence': self._get_confidence_level(similarity_percentage),
+                    'important_features': self._get_important_features(
+                        feature_names[feature_indices],
+                        job_desc_tfidf[feature_indices],
+                        resume_tfidf[feature_indices]
+                    ),
+                    'feature_count': len(feature_names),
+                    'error': None
+                }
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error in TF-IDF calculation: {str(e)}")
+            return [{**insufficient, 'error': f'Calculation error: {str(e)}'} for _ in resumes]
+    
     def calculate_bert_similarity(self, job_desc: str, resume: str) -> Dict[str, any]:
         """
         Calculate similarity using BERT embeddings.
@@ -121,15 +284,12 @@ class SimilarityCalculator:
             Dict[str, any]: BERT similarity results
         """
         try:
-            # Load BERT model if not already loaded
-            if self.bert_model is None:
-                self._load_bert_model()
-            
-            # Preprocess texts
-            processed_job_desc = self._preprocess_for_bert(job_desc)
-            processed_resume = self._preprocess_for_bert(resume)
+            # Encode both texts in a single forward pass
+            embeddings = self.encode_bert_batch([job_desc, resume], batch_size=2)
+            scores, resume_norms = _cosine_scores(embeddings[1:], embeddings[0])
             
-            if not processed_job_desc or not processed_resume:
+            # Empty texts come back as all-zero rows
+            if not embeddings[0].any() or resume_norms[0] == 0:
                 return {
                     'method': 'BERT',
                     'similarity_score': 0.0,
@@ -137,9 +297,47 @@ class SimilarityCalculator:
                     'error': 'Insufficient text for analysis'
                 }
             
-            # Get BERT embeddings
-            job_desc_embeddings = self._get_bert_embeddings(processed_job_desc)
-            resume_embeddings = self._get_bert_embeddings(processed_resume)
+            return self._build_bert_result(float(scores[0]), embeddings.shape[1])
+            
+        except Exception as e:
+            logger.error(f"Error in BERT calculation: {str(e)}")
+            return {
+                'method': 'BERT',
+                'similarity_score': 0.0,
+                'confidence': 'low',
+                'error': f'Calculation error: {str(e)}'
+            }
+    
+    def calculate_bert_similarity_precomputed(self, encoded_job_desc: Dict[str, any], resume: str) -> Dict[str, any]:
+        """
+        Calculate BERT similarity against an already encoded job description.
+        
+        Args:
+            encoded_job_desc (Dict[str, any]): Output of encode_job_description
+            resume (str): Resume text
+            
+        Returns:
+            Dict[str, any]: BERT similarity results
+        """
+        if encoded_job_desc['bert_error']:
+            return {
+                'method': 'BERT',
+                'similarity_score': 0.0,
+                'confidence': 'low',
+                'error': encoded_job_desc['bert_error']
+            }
+        
+        try:
+            job_desc_embeddings = encoded_job_desc['bert_embedding']
+            resume_embeddings = self.encode_bert(resume)
+            
+            if job_desc_embeddings is None or resume_embeddings is None:
+                return {
+                    'method': 'BERT',
+                    'similarity_score': 0.0,
+                    'confidence': 'low',
+                    'error': 'Insufficient text for analysis'
+                }
             
             # Calculate cosine similarity
             similarity_score = F.cosine_similarity(
@@ -147,20 +345,7 @@ class SimilarityCalculator:
                 resume_embeddings.unsqueeze(0)
             ).item()
             
-            # Convert to percentage
-            similarity_percentage = similarity_score * 100
-            
-            # Determine confidence level
-            confidence = self._get_confidence_level(similarity_percentage)
-            
-            return {
-                'method': 'BERT',
-                'similarity_score': round(similarity_percentage, 2),
-                'raw_score': similarity_score,
-                'confidence': confidence,
-                'embedding_dimension': job_desc_embeddings.shape[0],
-                'error': None
-            }
+            return self._build_bert_result(similarity_score, job_desc_embeddings.shape[0])
             
         except Exception as e:
             logger.error(f"Error in BERT calculation: {str(e)}")
@@ -171,6 +356,72 @@ class SimilarityCalculator:
                 'error': f'Calculation error: {str(e)}'
             }
     
+    def calculate_bert_similarity_batch(self, encoded_job_desc: Dict[str, any], resumes: List[str], 
+                                        batch_size: int = 32,
+                                        resume_embeddings: Optional[np.ndarray] = None) -> List[Dict[str, any]]:
+        """
+        Calculate BERT similarity for many resumes against one encoded job description.
+        
+        Args:
+            encoded_job_desc (Dict[str, any]): Output of encode_job_description
+            resumes (List[str]): Resume texts
+            batch_size (int): Number of resumes per BERT forward pass
+            resume_embeddings (np.ndarray, optional): encode_bert_batch output for resumes,
+                if already computed
+            
+        Returns:
+            List[Dict[str, any]]: BERT similarity results, one per resume
+        """
+        insufficient = {
+            'method': 'BERT',
+            'similarity_score': 0.0,
+            'confidence': 'low',
+            'error': 'Insufficient text for analysis'
+        }
+        
+        if encoded_job_desc['bert_error']:
+            return [{**insufficient, 'error': encoded_job_desc['bert_error']} for _ in resumes]
+        
+        if encoded_job_desc['bert_embedding'] is None:
+            return [dict(insufficient) for _ in resumes]
+        
+        try:
+            # One (N, D) matrix for all resumes
+            resume_matrix = (
+                resume_embeddings if resume_embeddings is not None
+                else self.encode_bert_batch(resumes, batch_size=batch_size)
+            )
+            job_desc_vector = encoded_job_desc['bert_embedding'].float().cpu().numpy()
+            
+            # Score every resume against the job description in one kernel call
+            scores, resume_norms = _cosine_scores(resume_matrix, job_desc_vector)
+            
+            return [
+                self._build_bert_result(float(score), job_desc_vector.shape[0]) if norm > 0 else dict(insufficient)
+                for score, norm in zip(scores, resume_norms)
+            ]
+            
+        except Exception as e:
+            logger.error(f"Error in BERT calculation: {str(e)}")
+            return [{**insufficient, 'error': f'Calculation error: {str(e)}'} for _ in resumes]
+    
+    def _build_bert_result(self, similarity_score: float, embedding_dimension: int) -> Dict[str, any]:
+        """Build the BERT result dictionary from a raw cosine similarity."""
+        # Convert to percentage
+        similarity_percentage = similarity_score * 100
+        
+        # Determine confidence level
+        confidence = self._get_confidence_level(similarity_percentage)
+        
+        return {
+            'method': 'BERT',
+            'similarity_score': round(similarity_percentage, 2),
+            'raw_score': similarity_score,
+            'confidence': confidence,
+            'embedding_dimension': embedding_dimension,
+            'error': None
+        }
+    
     def calculate_combined_similarity(self, job_desc: str, resume: str) -> Dict[str, any]:
         """
         Calculate similarity using both methods and combine results.
@@ -182,10 +433,17 @@ class SimilarityCalculator:
         Returns:
             Dict[str, any]: Combined similarity results
         """
+        encoded_job_desc = self.encode_job_description(job_desc)
+        
         # Calculate both similarities
-        tfidf_results = self.calculate_tfidf_similarity(job_desc, resume)
-        bert_results = self.calculate_bert_similarity(job_desc, resume)
+        tfidf_results = self.calculate_tfidf_similarity_precomputed(encoded_job_desc, resume)
+        bert_results = self.calculate_bert_similarity_precomputed(encoded_job_desc, resume)
         
+        return self._combine_similarity_results(tfidf_results, bert_results)
+    
+    def _combine_similarity_results(self, tfidf_results: Dict[str, any], 
+                                    bert_results: Dict[str, any]) -> Dict[str, any]:
+        """Combine TF-IDF and BERT results into a weighted overall score."""
         # Calculate weighted average (TF-IDF: 40%, BERT: 60%)
         tfidf_weight = 0.4
         bert_weight = 0.6
@@ -212,6 +470,121 @@ class SimilarityCalculator:
             'weights': {'tfidf': tfidf_weight, 'bert': bert_weight}
         }
     
+    def encode_job_description(self, job_desc: str, use_tfidf: bool = True, 
+                               use_bert: bool = True) -> Dict[str, any]:
+        """
+        Preprocess and embed a job description once so it can be compared
+        against many resumes without re-encoding it each time.
+        
+        Args:
+            job_desc (str): Job description text
+            use_tfidf (bool): Whether to prepare the TF-IDF representation
+            use_bert (bool): Whether to compute the BERT embedding
+            
+        Returns:
+            Dict[str, any]: Encoded job description
+        """
+        encoded = {
+            'tfidf_text': self._preprocess_for_tfidf(job_desc) if use_tfidf else "",
+            'bert_embedding': None,
+            'bert_error': None,
+            'statistics': self._get_text_statistics(job_desc)
+        }
+        
+        if use_bert:
+            try:
+                encoded['bert_embedding'] = self.encode_bert(job_desc)
+            except Exception as e:
+                logger.error(f"Error in BERT calculation: {str(e)}")
+                encoded['bert_error'] = f'Calculation error: {str(e)}'
+        
+        return encoded
+    
+    def encode_bert(self, text: str) -> Optional[torch.Tensor]:
+        """
+        Get the BERT embedding for a text, loading the model on first use.
+        
+        Embeddings are served from the same content-hash cache as
+        encode_bert_batch, so a job description or resume seen before is
+        not run through BERT again.
+        
+        Args:
+            text (str): Text to encode
+            
+        Returns:
+            Optional[torch.Tensor]: Embedding, or None if there is no text to encode
+        """
+        if not self._preprocess_for_bert(text):
+            return None
+        
+        embedding = self.encode_bert_batch([text], batch_size=1)[0]
+        return torch.from_numpy(embedding).to(self.device)
+    
+    def encode_bert_batch(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        """
+        Get BERT embeddings for many texts using batched forward passes.
+        
+        Args:
+            texts (List[str]): Texts to encode
+            batch_size (int): Number of texts per forward pass
+            
+        Returns:
+            np.ndarray: (N, D) float32 embeddings; rows for empty texts are all zeros
+        """
+        # Load BERT model if not already loaded; the model is swapped, never modified in
+        # place, so this snapshot stays valid while another thread changes precision
+        with self._model_lock:
+            if self.bert_model is None:
+                self._load_bert_model()
+            bert_model, bert_tokenizer, precision = self.bert_model, self.bert_tokenizer, self._bert_precision
+        
+        processed_texts = [self._preprocess_for_bert(text) for text in texts]
+        embeddings = np.zeros((len(texts), bert_model.config.hidden_size), dtype=np.float32)
+        
+        # Reuse embeddings of texts seen in earlier calls at the same precision
+        text_hashes = [
+            (BERT_MODEL_NAME, precision, hashlib.sha256(text.encode()).hexdigest()) for text in processed_texts
+        ]
+        to_encode = []
+        with self._embedding_cache_lock:
+            for i, (text, text_hash) in enumerate(zip(processed_texts, text_hashes)):
+                if not text:
+                    continue
+                if text_hash in self._embedding_cache:
+                    self._embedding_cache.move_to_end(text_hash)
+                    embeddings[i] = self._embedding_cache[text_hash]
+                else:
+                    to_encode.append(i)
+        
+        for start in range(0, len(to_encode), batch_size):
+            batch_indices = to_encode[start:start + batch_size]
+            
+            inputs = bert_tokenizer(
+                [processed_texts[i] for i in batch_indices], 
+                return_tensors="pt", 
+                truncation=True, 
+                padding=True, 
+                max_length=512
+            )
+            inputs = {k: v.to(self.device) for k, v in inputs.items()}
+            
+            with torch.no_grad(), self._autocast():
+                outputs = bert_model(**inputs)
+            
+            # Mean pooling over real tokens only, so padding does not change the embedding
+            hidden = outputs.last_hidden_state.float()
+            mask = inputs['attention_mask'].unsqueeze(-1).to(hidden.dtype)
+            pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1)
+            embeddings[batch_indices] = pooled.cpu().numpy()
+        
+        with self._embedding_cache_lock:
+            for i in to_encode:
+                self._embedding_cache[text_hashes[i]] = embeddings[i].copy()
+            while len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
+        
+        return embeddings
+    
     def _preprocess_for_tfidf(self, text: str) -> str:
         """Preprocess text for TF-IDF analysis."""
         if not text:
@@ -236,18 +609,26 @@ class SimilarityCalculator:
         return text
     
     def _load_bert_model(self):
-        """Load BERT model and tokenizer."""
+        """Load BERT model and tokenizer; callers hold _model_lock."""
         try:
             from transformers import BertTokenizer, BertModel
             
             logger.info("Loading BERT model...")
-            self.bert_tokenizer = BertTokenizer.from_pretrained('bert-base-uncased')
-            self.bert_model = BertModel.from_pretrained('bert-base-uncased')
+            self.bert_tokenizer = BertTokenizer.from_pretrained(BERT_MODEL_NAME)
+            self.bert_model = BertModel.from_pretrained(BERT_MODEL_NAME)
+            self._bert_precision = 'fp32'
             
             # Move to device
             self.bert_model.to(self.device)
             self.bert_model.eval()
             
+            if self.use_gpu:
+                # Allow TF32 tensor cores for the FP32 matmuls left outside autocast
+                torch.set_float32_matmul_precision('high')
+            
+            if self.reduced_precision:
+                self._apply_reduced_precision()
+            
             logger.info("BERT model loaded successfully")
             
         except ImportError:
@@ -258,28 +639,49 @@ class SimilarityCalculator:
             logger.error(f"Error loading BERT model: {str(e)}")
             raise
     
-    def _get_bert_embeddings(self, text: str) -> torch.Tensor:
-        """Get BERT embeddings for the given text."""
-        # Tokenize and encode
-        inputs = self.bert_tokenizer(
-            text, 
-            return_tensors="pt", 
-            truncation=True, 
-            padding=True, 
-            max_length=512
-        )
-        
-        # Move inputs to device
-        inputs = {k: v.to(self.device) for k, v in inputs.items()}
-        
-        # Get embeddings
-        with torch.no_grad():
-            outputs = self.bert_model(**inputs)
+    def quantize_dynamic(self):
+        """
+        Run BERT at reduced precision for higher throughput.
         
-        # Use mean pooling of last hidden state
-        embeddings = outputs.last_hidden_state.mean(dim=1).squeeze()
+        On CPU the Linear layers are dynamically quantized to int8; on GPU the
+        model is cast to FP16. Takes effect immediately if the model is loaded,
+        otherwise when it is first loaded. Scores may differ slightly from
+        full-precision results.
+        """
+        with self._model_lock:
+            if self.reduced_precision:
+                return
+            
+            self.reduced_precision = True
+            # Full-precision embeddings are keyed apart and will not be reused
+            with self._embedding_cache_lock:
+                self._embedding_cache.clear()
+            
+            if self.bert_model is not None:
+                self._apply_reduced_precision()
+    
+    def _apply_reduced_precision(self):
+        """Replace the loaded BERT model with an int8 (CPU) or FP16 (GPU) copy; callers hold _model_lock."""
+        if self.use_gpu:
+            # Convert a copy so forward passes already running on the FP32 model are unaffected
+            self.bert_model = copy.deepcopy(self.bert_model).half()
+            self._bert_precision = 'fp16'
+            logger.info("BERT model converted to FP16")
+            return
         
-        return embeddings
+        try:
+            self.bert_model = torch.ao.quantization.quantize_dynamic(
+                self.bert_model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            self._bert_precision = 'int8'
+            logger.info("BERT model quantized to int8")
+        except Exception as e:
+            # Some platforms have no quantized kernels; keep the FP32 model
+            logger.warning(f"Could not quantize BERT model: {str(e)}")
+    
+    def _autocast(self):
+        """FP16 autocast context for BERT forward passes on GPU; a no-op on CPU."""
+        return torch.autocast(device_type=self.device.type, dtype=torch.float16, enabled=self.use_gpu)
     
     def _get_important_features(self, feature_names: np.ndarray, 
                                job_desc_tfidf: np.ndarray, 
@@ -367,16 +769,62 @@ class SimilarityCalculator:
             job_desc (str): Job description text
             resume (str): Resume text
             
+        Returns:
+            Dict[str, any]: Comprehensive similarity breakdown
+        """
+        return self.get_similarity_breakdown_precomputed(self.encode_job_description(job_desc), resume)
+    
+    def get_similarity_breakdown_precomputed(self, encoded_job_desc: Dict[str, any], resume: str) -> Dict[str, any]:
+        """
+        Get a comprehensive similarity breakdown against an already encoded job description.
+        
+        Args:
+            encoded_job_desc (Dict[str, any]): Output of encode_job_description
+            resume (str): Resume text
+            
         Returns:
             Dict[str, any]: Comprehensive similarity breakdown
         """
         # Calculate all similarity methods
-        tfidf_results = self.calculate_tfidf_similarity(job_desc, resume)
-        bert_results = self.calculate_bert_similarity(job_desc, resume)
-        combined_results = self.calculate_combined_similarity(job_desc, resume)
+        tfidf_results = self.calculate_tfidf_similarity_precomputed(encoded_job_desc, resume)
+        bert_results = self.calculate_bert_similarity_precomputed(encoded_job_desc, resume)
+        
+        return self._build_similarity_breakdown(encoded_job_desc, resume, tfidf_results, bert_results)
+    
+    def get_similarity_breakdown_batch(self, encoded_job_desc: Dict[str, any], resumes: List[str], 
+                                       batch_size: int = 32,
+                                       resume_embeddings: Optional[np.ndarray] = None) -> List[Dict[str, any]]:
+        """
+        Get similarity breakdowns for many resumes, batching the BERT encoding.
+        
+        Args:
+            encoded_job_desc (Dict[str, any]): Output of encode_job_description
+            resumes (List[str]): Resume texts
+            batch_size (int): Number of resumes per BERT forward pass
+            resume_embeddings (np.ndarray, optional): encode_bert_batch output for resumes,
+                if already computed
+            
+        Returns:
+            List[Dict[str, any]]: Comprehensive similarity breakdowns, one per resume
+        """
+        tfidf_batch = self.calculate_tfidf_similarity_batch(encoded_job_desc, resumes)
+        bert_batch = self.calculate_bert_similarity_batch(
+            encoded_job_desc, resumes, batch_size=batch_size, resume_embeddings=resume_embeddings
+        )
+        
+        return [
+            self._build_similarity_breakdown(encoded_job_desc, resume, tfidf_results, bert_results)
+            for resume, tfidf_results, bert_results in zip(resumes, tfidf_batch, bert_batch)
+        ]
+    
+    def _build_similarity_breakdown(self, encoded_job_desc: Dict[str, any], resume: str, 
+                                    tfidf_results: Dict[str, any], 
+                                    bert_results: Dict[str, any]) -> Dict[str, any]:
+        """Assemble the breakdown dictionary from per-method results."""
+        combined_results = self._combine_similarity_results(tfidf_results, bert_results)
         
         # Get text statistics
-        job_desc_stats = self._get_text_statistics(job_desc)
+        job_desc_stats = encoded_job_desc['statistics']
         resume_stats = self._get_text_statistics(resume)
         
         return {
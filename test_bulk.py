@@ -7,7 +7,9 @@ This script demonstrates the key features of the bulk processor.
 import os
 import tempfile
 from pathlib import Path
+import pandas as pd
 from bulk_processor import BulkResumeProcessor
+from file_handler import FileHandler
 
 def create_sample_files():
     """Create sample text files for testing."""
@@ -88,6 +90,27 @@ def cleanup_temp_files(temp_files):
         except:
             pass
 
+def verify_excel_export(file_path, results):
+    """Read an Excel export back and check that no sheet lost data."""
+    # Keep 'N/A' placeholders as text so only truly empty cells count as missing
+    sheets = pd.read_excel(file_path, sheet_name=None, keep_default_na=False)
+    
+    results_sheet = sheets['Results']
+    if len(results_sheet) != len(results['results']):
+        return False, f"Results sheet has {len(results_sheet)} rows, expected {len(results['results'])}"
+    for column in ['Filename', 'Similarity Score (%)', 'Word Count', 'Status']:
+        if (results_sheet[column].astype(str) == '').any():
+            return False, f"Results sheet column '{column}' has missing values"
+    
+    if len(sheets['Summary']) != 5 or (sheets['Summary']['Value'].astype(str) == '').any():
+        return False, "Summary sheet is incomplete"
+    
+    distribution = results['summary']['score_distribution']
+    if len(sheets['Score Distribution']) != len(distribution):
+        return False, "Score Distribution sheet is incomplete"
+    
+    return True, "all sheets read back intact"
+
 def test_bulk_processing():
     """Test the bulk processing functionality."""
     print("🏭 I Knowledge Factory Pvt. Ltd.")
@@ -159,6 +182,9 @@ def test_bulk_processing():
             success, file_path_or_error = bulk_processor.export_bulk_results(results, export_format)
             if success:
                 print(f"✅ {export_format.upper()} export successful: {file_path_or_error}")
+                if export_format == 'excel':
+                    intact, message = verify_excel_export(file_path_or_error, results)
+                    print(f"{'✅' if intact else '❌'} Excel round-trip: {message}")
                 # Clean up exported file
                 try:
                     os.unlink(file_path_or_error)
@@ -183,5 +209,74 @@ def test_bulk_processing():
         cleanup_temp_files(temp_files)
         print("\n🧹 Temporary files cleaned up")
 
+def test_scoring_failure_isolated():
+    """Check that one resume breaking the scorer does not fail the rest of the batch."""
+    print("\n🧪 Testing scoring failure isolation...")
+    temp_files = create_sample_files()
+    
+    try:
+        bulk_processor = BulkResumeProcessor()
+        resolve_scorer = bulk_processor._resolve_scorer
+        
+        def resolve_failing_scorer(comparison_method):
+            score_fn = resolve_scorer(comparison_method)
+            
+            # Any batch containing Jane's resume raises, as a scorer bug on one text would
+            def failing_score_fn(resume_texts, resume_embeddings=None):
+                if any('JANE SMITH' in text for text in resume_texts):
+                    raise ValueError("unscorable resume")
+                return score_fn(resume_texts, resume_embeddings)
+            
+            return failing_score_fn
+        
+        bulk_processor._resolve_scorer = resolve_failing_scorer
+        results = bulk_processor.process_bulk_resumes(
+            "Senior Software Engineer with Python and AWS", 
+            temp_files, 
+            "TF-IDF Only"
+        )
+        
+        statuses = {r['filename']: r['status'] for r in results['results']}
+        expected = {
+            'John_Doe_Resume.txt': 'success',
+            'Jane_Smith_CV.txt': 'failed',
+            'Bob_Johnson_Resume.txt': 'success'
+        }
+        if statuses == expected and results['summary']['successful'] == 2 and results['summary']['failed'] == 1:
+            print("✅ Only the unscorable resume failed; the others were scored")
+            return True
+        
+        print(f"❌ Unexpected statuses: {statuses}")
+        return False
+        
+    finally:
+        cleanup_temp_files(temp_files)
+
+def test_cp1252_text_decoding():
+    """Check that a Windows-1252 text resume keeps its accented characters."""
+    print("\n🧪 Testing cp1252 text decoding...")
+    expected = "Zoë Martin\nSkills: naïve Bayes, café-style résumé parsing"
+    
+    temp_file = tempfile.NamedTemporaryFile(suffix='.txt', delete=False)
+    temp_file.write(expected.encode('cp1252'))
+    temp_file.close()
+    
+    try:
+        file_handler = FileHandler()
+        file_handler.extract_cache_dir = None
+        success, text = file_handler.extract_text(temp_file.name)
+        
+        if success and text == expected:
+            print("✅ cp1252 text decoded intact")
+            return True
+        
+        print(f"❌ cp1252 text decoded as: {text!r}")
+        return False
+        
+    finally:
+        os.unlink(temp_file.name)
+
 if __name__ == "__main__":
     test_bulk_processing()
+    test_scoring_failure_isolated()
+    test_cp1252_text_decoding()
@@ -3,6 +3,7 @@ Text processing module for resume-job description comparison.
 Handles text preprocessing, cleaning, and analysis using spaCy.
 """
 
+import os
 import re
 import logging
 from typing import List, Dict, Tuple, Optional
@@ -13,6 +14,10 @@ from collections import Counter
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Trimmed copy of en_core_web_sm written by install.py (sentence recognizer instead of parser);
+# anchored to the package directory so the app finds it from any working directory
+FAST_MODEL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'temp', 'en_core_web_sm_fast')
+
 class TextProcessor:
     """
     A class for processing and analyzing text using spaCy.
@@ -27,8 +32,7 @@ class TextProcessor:
             model_name (str): Name of the spaCy model to use
         """
         try:
-            self.nlp = spacy.load(model_name)
-            logger.info(f"Loaded spaCy model: {model_name}")
+            self.nlp = self._load_model(model_name)
         except OSError:
             logger.error(f"spaCy model '{model_name}' not found. Please install it using:")
             logger.error(f"python -m spacy download {model_name}")
@@ -50,6 +54,20 @@ class TextProcessor:
             'ml_ai': ['tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy']
         }
     
+    def _load_model(self, model_name: str):
+        """Load the spaCy model, preferring the trimmed install-time copy of the default model."""
+        if model_name == "en_core_web_sm" and os.path.isdir(FAST_MODEL_DIR):
+            try:
+                nlp = spacy.load(FAST_MODEL_DIR)
+                logger.info(f"Loaded spaCy model: {model_name} (trimmed copy at {FAST_MODEL_DIR})")
+                return nlp
+            except Exception as e:
+                logger.warning(f"Could not load trimmed spaCy model, using {model_name}: {str(e)}")
+        
+        nlp = spacy.load(model_name)
+        logger.info(f"Loaded spaCy model: {model_name}")
+        return nlp
+    
     def preprocess_text(self, text: str, remove_stopwords: bool = True) -> str:
         """
         Preprocess the input text by cleaning and normalizing it.
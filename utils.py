@@ -457,8 +457,21 @@ class ExportUtils:
                 'results': results
             }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            try:
+                import orjson
+            except ImportError:
+                orjson = None
+            
+            if orjson is not None:
+                # Native serializer; also handles NumPy scores without conversion
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(
+                        export_data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                    ))
+            else:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(export_data, f, indent=2, ensure_ascii=False)
             
             logger.info(f"Results exported to {file_path}")
             return True, ""